@@ -5,62 +5,258 @@ and displays current time, temperature, feels-like temperature, and humidity
 on a 7-segment LED display.
 """
 
-import ntplib
-import configparser
-import requests
-import adafruit_ht16k33.segments as segments
-import busio
-import board
+import functools
+import json
 import os
+import random
+import re
+import signal
+import socket
+import struct
 import sys
+import threading
 import time
-import signal
-import types
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# The lgpio library (used by board/busio) creates notification files in its
+# working directory, which defaults to the cwd. /opt/rpi-clock has restrictive
+# permissions, so point lgpio at the system temp directory via LG_WD instead of
+# chdir-ing the whole process there. Must be set before the hardware imports.
+os.environ.setdefault("LG_WD", "/tmp")
+
+import adafruit_ht16k33.segments as segments  # noqa: E402
+import board  # noqa: E402
+import busio  # noqa: E402
+
+if TYPE_CHECKING:
+    import requests  # Imported on demand in initialize_http_session()
+
+try:
+    import orjson  # Rust-backed parser, optional
 
-# Change to /tmp directory to avoid GPIO permission issues
-# The lgpio library tries to create notification files in the current working directory
-# /opt/rpi-clock has restrictive permissions, so we switch to system temp directory
-os.chdir("/tmp")
+    json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    json_loads = json.loads  # stdlib also parses bytes
 
 
 # Constants - avoid repeated lookups
 API_ENDPOINT: str = "https://api.openweathermap.org/data/2.5/weather"
 CONFIG_FILE: str = "/opt/rpi-clock/config.ini"
 
-# Pre-compile regex patterns and cache config values
-config: configparser.ConfigParser = configparser.ConfigParser()
-config.read_dict(
-    {
-        "Weather": {"api_key": "your_api_key_here", "zip_code": "your_zip_code_here", "refresh_minutes": "15"},
-        "Display": {
-            "time_format": "12",
-            "temp_unit": "C",
-            "smooth_scroll": "false",
-            "brightness": "0.8",
-        },
-        "NTP": {"preferred_server": "127.0.0.1"},
-        "Cycle": {
-            "time_display": "2",
-            "temp_display": "3",
-            "feels_like_display": "3",
-            "humidity_display": "2",
-        },
-        "CustomText": {
-            "enabled": "false",
-            "text": "",
-            "interval_minutes": "15",
-            "display_duration": "3",
-        },
-    }
-)
-config.read(CONFIG_FILE)
+ConfigData = Dict[str, Dict[str, str]]  # section -> option -> raw string value
+
+CONFIG_DEFAULTS: ConfigData = {
+    "Weather": {
+        "api_key": "your_api_key_here",
+        "zip_code": "your_zip_code_here",
+        "refresh_minutes": "15",
+    },
+    "Display": {
+        "time_format": "12",
+        "temp_unit": "C",
+        "smooth_scroll": "false",
+        "brightness": "0.8",
+    },
+    "NTP": {"preferred_server": "127.0.0.1"},
+    "Cycle": {
+        "time_display": "2",
+        "temp_display": "3",
+        "feels_like_display": "3",
+        "humidity_display": "2",
+    },
+    "CustomText": {
+        "enabled": "false",
+        "text": "",
+        "interval_minutes": "15",
+        "display_duration": "3",
+    },
+}
+
+
+INI_OPTION_RE: "re.Pattern[str]" = re.compile(r"([^=:]*)[=:](.*)")
+
+
+def parse_ini(lines: Iterable[str]) -> ConfigData:
+    """Parse the subset of INI syntax config.ini uses.
+
+    Handles [section] headers, key = value and key: value pairs and
+    full-line '#'/';' comments. Keys are lower-cased as ConfigParser does;
+    values are kept as raw strings for validate_config() to check.
+
+    Args:
+        lines: Lines of INI text
+
+    Returns:
+        ConfigData: Parsed options by section
+    """
+    data: ConfigData = {}
+    options: Dict[str, str] = {}
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            options = data.setdefault(line[1:-1].strip(), {})
+            continue
+        # Split on the first '=' or ':', whichever comes first, like ConfigParser
+        match = INI_OPTION_RE.match(line)
+        if match:
+            options[match.group(1).strip().lower()] = match.group(2).strip()
+        else:
+            print(f"⚠  Ignoring unparseable config line: {line}")
+    return data
+
+
+def load_config(path: str) -> ConfigData:
+    """Load config.ini over the built-in defaults.
+
+    A missing or unreadable file leaves just the defaults, as
+    ConfigParser.read() did; validate_config() reports the missing file.
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        ConfigData: Defaults overlaid with the file's options
+    """
+    data = {section: dict(options) for section, options in CONFIG_DEFAULTS.items()}
+    try:
+        with open(path, encoding="utf-8") as f:
+            parsed = parse_ini(f)
+    except OSError:
+        return data
+    for section, options in parsed.items():
+        data.setdefault(section, {}).update(options)
+    return data
+
+
+# Read once with a minimal parser - configparser is far more machinery (and
+# import time) than a dozen key = value lines need
+config: ConfigData = load_config(CONFIG_FILE)
+
+
+def _check_api_key(value: str) -> Optional[str]:
+    """Reject an empty or placeholder OpenWeatherMap API key."""
+    if not value.strip():
+        return (
+            "Weather API key is empty - get one from "
+            "https://openweathermap.org/api_keys/"
+        )
+    if value == "your_openweathermap_api_key_here":
+        return "Weather API key not configured - please edit config.ini"
+    return None
+
+
+def _check_zip5(value: str) -> Optional[str]:
+    """Require a configured 5-digit ZIP code."""
+    if not value.strip():
+        return "ZIP code is empty - please configure your location"
+    if value == "your_zip_code_here":
+        return "ZIP code not configured - please edit config.ini"
+    if not value.isdigit() or len(value) != 5:
+        return "ZIP code must be 5 digits"
+    return None
+
+
+def _check_int_range(
+    value: str, low: int, high: int, label: str, suffix: str = ""
+) -> Optional[str]:
+    """Require an integer between low and high inclusive."""
+    try:
+        number = int(value)
+    except (ValueError, TypeError):
+        return f"{label} must be a valid integer"
+    if number < low or number > high:
+        return f"{label} must be between {low} and {high}{suffix}"
+    return None
+
+
+def _check_brightness(value: str) -> Optional[str]:
+    """Require a brightness between 0.0 and 1.0."""
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return "brightness must be a valid number between 0.0 and 1.0"
+    if number < 0.0 or number > 1.0:
+        return "brightness must be between 0.0 and 1.0"
+    return None
+
+
+def _check_choice(value: str, label: str, first: str, second: str) -> Optional[str]:
+    """Require one of two allowed values (case-insensitive)."""
+    if value.strip().lower() not in (first.lower(), second.lower()):
+        return f"{label} must be '{first}' or '{second}'"
+    return None
+
+
+def _check_custom_text(value: str) -> Optional[str]:
+    """Require non-empty custom text that fits a short scroll."""
+    if not value.strip():
+        return "CustomText text cannot be empty when enabled"
+    if len(value) > 50:
+        return "CustomText text should be 50 characters or less for optimal display"
+    return None
+
+
+# Check tag -> validator returning an error message, or None when valid
+CONFIG_CHECKS: Dict[str, Callable[..., Optional[str]]] = {
+    "api_key": _check_api_key,
+    "zip5": _check_zip5,
+    "int_range": _check_int_range,
+    "brightness": _check_brightness,
+    "choice": _check_choice,
+    "custom_text": _check_custom_text,
+}
+
+# Declarative config schema: section -> option -> (check tag, *check args)
+CONFIG_SCHEMA: Dict[str, Dict[str, Tuple[Any, ...]]] = {
+    "Weather": {
+        "api_key": ("api_key",),
+        "zip_code": ("zip5",),
+        "refresh_minutes": ("int_range", 5, 1440, "Weather refresh_minutes"),
+    },
+    "Display": {
+        "time_format": ("choice", "time_format", "12", "24"),
+        "temp_unit": ("choice", "temp_unit", "C", "F"),
+        "smooth_scroll": ("choice", "smooth_scroll", "true", "false"),
+        "brightness": ("brightness",),
+    },
+    "NTP": {},
+    "Cycle": {
+        option: ("int_range", 1, 60, option, " seconds")
+        for option in (
+            "time_display",
+            "temp_display",
+            "feels_like_display",
+            "humidity_display",
+        )
+    },
+    "CustomText": {
+        "enabled": ("choice", "CustomText enabled", "true", "false"),
+        "text": ("custom_text",),
+        "interval_minutes": ("int_range", 1, 1440, "CustomText interval_minutes"),
+        "display_duration": (
+            "int_range",
+            1,
+            60,
+            "CustomText display_duration",
+            " seconds",
+        ),
+    },
+}
+# Sections whose remaining options are only checked when this option is true
+CONFIG_SCHEMA_GATES: Dict[str, str] = {"CustomText": "enabled"}
 
 
 def validate_config() -> bool:
     """Validate configuration file and values.
 
+    Each section's option dict is checked against CONFIG_SCHEMA in one pass.
+
     Returns:
         bool: True if configuration is valid, False otherwise
     """
@@ -71,108 +267,20 @@ def validate_config() -> bool:
         errors.append(f"Configuration file not found: {CONFIG_FILE}")
         return False
 
-    # Validate required sections
-    required_sections = ["Weather", "Display", "NTP", "Cycle", "CustomText"]
-    for section in required_sections:
-        if not config.has_section(section):
+    for section, fields in CONFIG_SCHEMA.items():
+        data = config.get(section)
+        if data is None:
             errors.append(f"Missing configuration section: [{section}]")
+            continue
 
-    # Validate Weather section
-    if config.has_section("Weather"):
-        api_key = config.get("Weather", "api_key", fallback="")
-        if not api_key.strip():
-            errors.append(
-                "Weather API key is empty - get one from "
-                "https://openweathermap.org/api_keys/"
-            )
-        elif api_key == "your_openweathermap_api_key_here":
-            errors.append("Weather API key not configured - please edit config.ini")
-
-        zip_code = config.get("Weather", "zip_code", fallback="")
-        if not zip_code.strip():
-            errors.append("ZIP code is empty - please configure your location")
-        elif zip_code == "your_zip_code_here":
-            errors.append("ZIP code not configured - please edit config.ini")
-        elif not zip_code.isdigit() or len(zip_code) != 5:
-            errors.append("ZIP code must be 5 digits")
-
-        try:
-            refresh = config.getint("Weather", "refresh_minutes")
-            if refresh < 5 or refresh > 1440:
-                errors.append("Weather refresh_minutes must be between 5 and 1440")
-        except (ValueError, TypeError):
-            errors.append("Weather refresh_minutes must be a valid integer")
-
-    # Validate Display section
-    if config.has_section("Display"):
-        time_format = config.get("Display", "time_format", fallback="")
-        if time_format not in ["12", "24"]:
-            errors.append("time_format must be '12' or '24'")
-
-        temp_unit = config.get("Display", "temp_unit", fallback="").strip().upper()
-        if temp_unit not in ["C", "F"]:
-            errors.append("temp_unit must be 'C' or 'F'")
-
-        smooth_scroll_raw = config.get("Display", "smooth_scroll", fallback="").strip().lower()
-        if smooth_scroll_raw not in ("true", "false"):
-            errors.append("smooth_scroll must be 'true' or 'false'")
-        SMOOTH_SCROLL = config.getboolean("Display", "smooth_scroll")
-
-        brightness = config.get("Display", "brightness", fallback="")
-        try:
-            brightness_val = float(brightness)
-            if brightness_val < 0.0 or brightness_val > 1.0:
-                errors.append("brightness must be between 0.0 and 1.0")
-        except (ValueError, TypeError):
-            errors.append("brightness must be a valid number between 0.0 and 1.0")
-
-    # Validate Cycle section
-    if config.has_section("Cycle"):
-        cycle_options = [
-            "time_display",
-            "temp_display",
-            "feels_like_display",
-            "humidity_display",
-        ]
-        for option in cycle_options:
-            try:
-                value = config.getint("Cycle", option)
-                if value < 1 or value > 60:
-                    errors.append(f"{option} must be between 1 and 60 seconds")
-            except (ValueError, TypeError):
-                errors.append(f"{option} must be a valid integer")
-
-    # Validate CustomText section
-    if config.has_section("CustomText"):
-        enabled = config.get("CustomText", "enabled", fallback="")
-        if enabled.lower() not in ["true", "false"]:
-            errors.append("CustomText enabled must be 'true' or 'false'")
-        elif enabled.lower() == "true":
-            custom_text = config.get("CustomText", "text", fallback="")
-            if not custom_text.strip():
-                errors.append("CustomText text cannot be empty when enabled")
-            elif len(custom_text) > 50:
-                errors.append(
-                    "CustomText text should be 50 characters or less for optimal display"
-                )
-
-            try:
-                interval = config.getint("CustomText", "interval_minutes")
-                if interval < 1 or interval > 1440:  # 1 minute to 24 hours
-                    errors.append(
-                        "CustomText interval_minutes must be between 1 and 1440"
-                    )
-            except (ValueError, TypeError):
-                errors.append("CustomText interval_minutes must be a valid integer")
-
-            try:
-                duration = config.getint("CustomText", "display_duration")
-                if duration < 1 or duration > 60:
-                    errors.append(
-                        "CustomText display_duration must be between 1 and 60 seconds"
-                    )
-            except (ValueError, TypeError):
-                errors.append("CustomText display_duration must be a valid integer")
+        gate = CONFIG_SCHEMA_GATES.get(section)
+        for option, (tag, *args) in fields.items():
+            value = data.get(option, "")
+            error = CONFIG_CHECKS[tag](value, *args)
+            if error:
+                errors.append(error)
+            if option == gate and (error or value.strip().lower() != "true"):
+                break
 
     # Print errors if any
     if errors:
@@ -191,41 +299,159 @@ if not validate_config():
     print("Configuration validation failed - exiting")
     sys.exit(1)
 
+
+@dataclass(frozen=True)
+class Cfg:
+    """Immutable snapshot of the validated configuration.
+
+    Built once at startup so the rest of the module reads plain attributes
+    instead of re-parsing the raw config strings on every use.
+    """
+
+    __slots__ = (
+        "api_key",
+        "zip_code",
+        "time_format",
+        "temp_unit",
+        "smooth_scroll",
+        "brightness",
+        "preferred_ntp_server",
+        "time_display",
+        "temp_display",
+        "feels_like_display",
+        "humidity_display",
+        "custom_text_enabled",
+        "custom_text",
+        "custom_text_interval_secs",
+        "custom_text_duration",
+        "weather_refresh_secs",
+    )
+
+    api_key: str
+    zip_code: str
+    time_format: str
+    temp_unit: str
+    smooth_scroll: bool
+    brightness: float
+    preferred_ntp_server: str
+    time_display: int
+    temp_display: int
+    feels_like_display: int
+    humidity_display: int
+    custom_text_enabled: bool
+    custom_text: str
+    custom_text_interval_secs: int
+    custom_text_duration: int
+    weather_refresh_secs: int
+
+
 # Cache all config values at startup
-API_KEY: str = config["Weather"]["api_key"]
-ZIP_CODE: str = config["Weather"]["zip_code"]
-TIME_FORMAT: str = config["Display"]["time_format"]
-TEMP_UNIT: str = config["Display"]["temp_unit"]
-SMOOTH_SCROLL: bool = config.getboolean("Display", "smooth_scroll")
-BRIGHTNESS: float = config.getfloat("Display", "brightness")
-PREFERRED_NTP_SERVER: str = config["NTP"]["preferred_server"]
-TIME_DISPLAY: int = config.getint("Cycle", "time_display")
-TEMP_DISPLAY: int = config.getint("Cycle", "temp_display")
-FEELS_LIKE_DISPLAY: int = config.getint("Cycle", "feels_like_display")
-HUMIDITY_DISPLAY: int = config.getint("Cycle", "humidity_display")
-CUSTOM_TEXT_ENABLED: bool = config.getboolean("CustomText", "enabled")
-CUSTOM_TEXT: str = config.get("CustomText", "text", fallback="")
-CUSTOM_TEXT_INTERVAL: int = config.getint("CustomText", "interval_minutes")
-CUSTOM_TEXT_DURATION: int = config.getint("CustomText", "display_duration")
-CUSTOM_TEXT_INTERVAL_SECONDS: int = CUSTOM_TEXT_INTERVAL * 60
-WEATHER_REFRESH_SECS: int = config.getint("Weather", "refresh_minutes") * 60
+CFG: Cfg = Cfg(
+    api_key=config["Weather"]["api_key"],
+    zip_code=config["Weather"]["zip_code"],
+    time_format=config["Display"]["time_format"],
+    temp_unit=config["Display"]["temp_unit"].strip().upper(),
+    smooth_scroll=config["Display"]["smooth_scroll"].lower() == "true",
+    brightness=float(config["Display"]["brightness"]),
+    preferred_ntp_server=config["NTP"]["preferred_server"],
+    time_display=int(config["Cycle"]["time_display"]),
+    temp_display=int(config["Cycle"]["temp_display"]),
+    feels_like_display=int(config["Cycle"]["feels_like_display"]),
+    humidity_display=int(config["Cycle"]["humidity_display"]),
+    custom_text_enabled=config["CustomText"]["enabled"].lower() == "true",
+    custom_text=config["CustomText"].get("text", ""),
+    custom_text_interval_secs=int(config["CustomText"]["interval_minutes"]) * 60,
+    custom_text_duration=int(config["CustomText"]["display_duration"]),
+    weather_refresh_secs=int(config["Weather"]["refresh_minutes"]) * 60,
+)
 
 # Pre-compute conversion factor
 C_TO_F_FACTOR: float = 9 / 5  # Avoid repeated division
 SCROLL_DELAY: float = 0.12  # Seconds per marquee step for smooth feel
+RETRY_BASE_DELAY: float = 3.0  # First weather retry waits ~3s, then doubles
+RETRY_MAX_DELAY: float = 60.0  # Cap on the exponential backoff
+DISPLAY_I2C_ADDRESS: int = 0x70  # HT16K33 default address (no jumpers)
+COLON_REGISTER: int = 0x04  # HT16K33 display RAM address holding the colon
+COLON_ON: int = 0x02  # Colon segment bit within that register
+DIGIT_REGISTERS: Tuple[int, ...] = (0x00, 0x02, 0x06, 0x08)  # Seg7x4 digit RAM
+DECIMAL_POINT: int = 0x80  # Decimal point bit within a digit register
+# Address prefix + RAM 0x00-0x09: digits and colon; 0x0A-0x0F are unwired
+FRAME_WRITE_LEN: int = 1 + DIGIT_REGISTERS[-1] + 2
+# Prebuilt register writes for the 1 Hz blink: (RAM address, colon byte)
+COLON_ON_WRITE: bytes = bytes((COLON_REGISTER, COLON_ON))
+COLON_OFF_WRITE: bytes = bytes((COLON_REGISTER, 0x00))
+NS_PER_SEC: int = 1_000_000_000
+NS_PER_MIN: int = 60 * NS_PER_SEC
+NTP_SYNC_INTERVAL_SECS: int = 900  # Re-query the NTP server at most every 15 min
+NTP_PORT: int = 123
+NTP_TIMEOUT_SECS: float = 5.0
+NTP_EPOCH_OFFSET: int = 2208988800  # Seconds from 1900-01-01 (NTP) to 1970 (Unix)
+NTP_PACKET_LEN: int = 48
+# SNTP client request up to the transmit timestamp: LI 0, version 4, mode 3
+NTP_REQUEST_HEADER: bytes = bytes((0x23,)) + bytes(39)
+WEATHER_MAX_BODY_BYTES: int = 4096  # OpenWeather replies are ~500 bytes
+# Refresh intervals a reading may outlive its freshness lifetime while fetches
+# keep failing (RFC 5861 stale-if-error); after that it is no longer shown
+WEATHER_STALE_IF_ERROR_INTERVALS: int = 2
+# After a failed refresh the next one waits a refresh interval, doubling per
+# consecutive failure up to this many times, so an outage isn't hammered
+WEATHER_FAILURE_MAX_DOUBLINGS: int = 2
+MAX_AGE_RE: "re.Pattern[str]" = re.compile(r"max-age=(\d+)")
+
+# Precomputed clock digits: display_time() is a table lookup and a concat
+HOUR_STR_12: List[str] = [f"{(h % 12 or 12):2d}" for h in range(24)]
+HOUR_STR_24: List[str] = [f"{h:2d}" for h in range(24)]
+MINUTE_STR: List[str] = [f"{m:02d}" for m in range(60)]
+HOUR_TABLE: List[str] = HOUR_STR_12 if CFG.time_format == "12" else HOUR_STR_24
+
+# Precomputed reading strings, indexed by whole degrees - TEMP_TABLE_MIN; covers
+# any plausible outdoor reading in C or F, anything else is formatted on demand
+TEMP_TABLE_MIN: int = -60
+TEMP_TABLE_MAX: int = 140
+TEMP_STRINGS: Dict[str, Tuple[str, ...]] = {
+    unit: tuple(f"{t}{unit}" for t in range(TEMP_TABLE_MIN, TEMP_TABLE_MAX + 1))
+    for unit in ("C", "F")
+}
+# Same, cut to the display's four characters and right-aligned
+TEMP_DISPLAY_STRINGS: Dict[str, Tuple[str, ...]] = {
+    unit: tuple(s[:4].rjust(4) for s in strings)
+    for unit, strings in TEMP_STRINGS.items()
+}
+HUMIDITY_STRINGS: Tuple[str, ...] = tuple(f"rH{h:02d}" for h in range(101))
 
 # Global variables
 cached_weather_info: Optional[Tuple[float, float, int]] = None
+weather_expires_at: float = 0.0  # monotonic time the next refresh is due
+weather_stale_at: float = 0.0  # monotonic time a failing refresh hides the reading
+_weather_failures: int = 0  # Consecutive failed refreshes, for the backoff
+weather_ttl: Optional[int] = None  # freshness lifetime from the last response
+# Cache validators from the last 200 and the reading they describe, for 304s
+_weather_etag: Optional[str] = None
+_weather_last_modified: Optional[str] = None
+_weather_validated: Optional[Tuple[float, float, int]] = None
 display: Optional[segments.Seg7x4] = None
-ntp_client: Optional[ntplib.NTPClient] = None  # Reuse NTP client
-SESSION: Optional[requests.Session] = None  # Reusable HTTP session
-WEATHER_PARAMS: Optional[Dict[str, str]] = None  # Prebuilt OpenWeather params
+_display_device: Any = None  # The display's I2CDevice, for direct writes
+ntp_socket: Optional[socket.socket] = None  # Reused SNTP datagram socket
+SESSION: Optional["requests.Session"] = None  # Reusable HTTP session
+WEATHER_URL: Optional[str] = None  # Prebuilt OpenWeather URL, query included
 
 # Display write cache
 last_display_text: Optional[str] = None
-last_time_minute: Optional[int] = None
+_last_flushed: bytearray = bytearray()  # Last frame sent to the HT16K33
 last_custom_text_time: Optional[float] = None
 
+# Background weather refresh state - guards the weather cache and its deadlines
+_refresh_lock: threading.Lock = threading.Lock()
+_refresh_inflight: bool = False
+
+# NTP offset cache - local clock + offset between periodic syncs
+ntp_offset: float = 0.0  # Seconds to add to time.time(), from the last sync
+last_ntp_sync: Optional[float] = None  # monotonic time of last good sync
+_ntp_failing: bool = False  # Last sync failed; suppresses repeat failure logs
+
+# Set by the signal handler; every wait in the display loop watches it
+_shutdown: threading.Event = threading.Event()
+
 
 def signal_handler(sig: int, frame: Any) -> None:
     """Handle graceful shutdown on SIGINT (Ctrl+C) or SIGTERM.
@@ -234,12 +460,50 @@ def signal_handler(sig: int, frame: Any) -> None:
         sig: Signal number
         frame: Current stack frame
     """
+    _shutdown.set()
     if display:
         display.fill(0)
-        display.show()
+        _fast_show()
     sys.exit(0)
 
 
+WIRING_HELP: Tuple[str, ...] = (
+    "  - VIN (red) → Pi pin 2 (5V)",
+    "  - IO (orange) → Pi pin 1 (3.3V) - REQUIRED",
+    "  - GND (black) → Pi pin 6 (GND)",
+    "  - SDA (yellow) → Pi pin 3 (GPIO 2)",
+    "  - SCL (white) → Pi pin 5 (GPIO 3)",
+)
+
+
+def print_wiring_help() -> None:
+    """Print the display's expected wiring, one connection per line."""
+    print("\n".join(WIRING_HELP))
+
+
+def kernel_module_loaded(name: str) -> bool:
+    """Check whether a kernel module is loaded.
+
+    Uses a single stat of /sys/module/<name>; /proc/modules is only read on
+    systems without sysfs.
+
+    Args:
+        name: Module name as shown by lsmod (e.g. "i2c_dev")
+
+    Returns:
+        bool: True if the module is loaded, False otherwise
+
+    Raises:
+        OSError: If neither sysfs nor /proc/modules can be read
+    """
+    if os.path.isdir("/sys/module"):
+        return os.path.isdir(f"/sys/module/{name}")
+    # Match the first field exactly so "i2c_dev" does not match "i2c_dev_foo"
+    wanted = name.encode()
+    with open("/proc/modules", "rb") as f:
+        return any(line.split(b" ", 1)[0] == wanted for line in f)
+
+
 def check_hardware_prerequisites() -> bool:
     """Check hardware prerequisites before attempting display initialization.
 
@@ -250,17 +514,15 @@ def check_hardware_prerequisites() -> bool:
 
     # Check if I2C modules are loaded
     try:
-        with open("/proc/modules", "r") as f:
-            modules = f.read()
-        if "i2c_dev" not in modules:
+        if not kernel_module_loaded("i2c_dev"):
             print("✗ I2C device module not loaded")
             print("  Run: sudo modprobe i2c_dev")
             return False
-        if "i2c_bcm2835" not in modules:
+        if not kernel_module_loaded("i2c_bcm2835"):
             print("✗ I2C BCM2835 module not loaded")
             print("  Run: sudo modprobe i2c_bcm2835")
             return False
-    except Exception as e:
+    except OSError as e:
         print(f"✗ Cannot check I2C modules: {e}")
         return False
 
@@ -272,26 +534,65 @@ def check_hardware_prerequisites() -> bool:
         print("  Then reboot the system")
         return False
 
-    # Check if user has I2C permissions
-    try:
-        import grp
+    # Check if user has I2C permissions. Access to the device node is what
+    # matters; the i2c group (an NSS lookup) is only consulted to explain a denial.
+    if not os.access("/dev/i2c-1", os.R_OK | os.W_OK):
+        try:
+            import grp
 
-        i2c_group = grp.getgrnam("i2c")
-        if i2c_group.gr_gid not in os.getgroups():
-            print("✗ User not in i2c group")
-            print("  Run: sudo usermod -a -G i2c $USER")
-            print("  Then logout and login again")
-            return False
-    except Exception as e:
-        print(f"✗ Cannot check I2C permissions: {e}")
+            i2c_group = grp.getgrnam("i2c")
+            if i2c_group.gr_gid not in os.getgroups():
+                print("✗ User not in i2c group")
+                print("  Run: sudo usermod -a -G i2c $USER")
+                print("  Then logout and login again")
+            else:
+                print("✗ No read/write access to /dev/i2c-1")
+                print("  Check the device permissions: ls -l /dev/i2c-1")
+        except KeyError:
+            print("✗ i2c group does not exist")
+            print("  Run: sudo apt install i2c-tools")
         return False
 
     print("✓ Hardware prerequisites check passed")
     return True
 
 
+@functools.lru_cache(maxsize=None)
+def _get_i2c() -> Any:
+    """Open the I2C bus once; the startup scan and the display driver share it."""
+    return busio.I2C(board.SCL, board.SDA)
+
+
+def probe_i2c_address(i2c: Any, address: int) -> bool:
+    """Check whether a device acknowledges at a single I2C address.
+
+    Mirrors adafruit_bus_device's probe: an empty write, falling back to a
+    one-byte read for adapters that reject zero-length messages.
+
+    Args:
+        i2c: An unlocked busio.I2C bus
+        address: 7-bit device address
+
+    Returns:
+        bool: True if a device responded, False otherwise
+    """
+    # Goes through busio so it shares Blinka's bus lock with the display driver
+    while not i2c.try_lock():
+        time.sleep(0)
+    try:
+        try:
+            i2c.writeto(address, b"")
+        except OSError:
+            i2c.readfrom_into(address, bytearray(1))
+        return True
+    except OSError:
+        return False
+    finally:
+        i2c.unlock()
+
+
 def scan_i2c_devices() -> bool:
-    """Scan I2C bus for devices and check for display.
+    """Probe the I2C bus for the display, scanning the whole bus only on a miss.
 
     Returns:
         bool: True if display is found at expected address, False otherwise
@@ -299,53 +600,46 @@ def scan_i2c_devices() -> bool:
     print("Scanning I2C bus for devices...")
 
     try:
-        i2c = busio.I2C(board.SCL, board.SDA)
+        i2c = _get_i2c()
+        if probe_i2c_address(i2c, DISPLAY_I2C_ADDRESS):
+            print("✓ Display found at address 0x70")
+            return True
+
+        # Only walk the full address range when it helps diagnose wiring
         devices = i2c.scan()
 
         if not devices:
             print("✗ No I2C devices found on bus")
             print("  Check your wiring:")
-            print("  - VIN (red) → Pi pin 2 (5V)")
-            print("  - IO (orange) → Pi pin 1 (3.3V) - REQUIRED")
-            print("  - GND (black) → Pi pin 6 (GND)")
-            print("  - SDA (yellow) → Pi pin 3 (GPIO 2)")
-            print("  - SCL (white) → Pi pin 5 (GPIO 3)")
+            print_wiring_help()
             return False
 
         print(f"✓ Found I2C devices at addresses: {[hex(addr) for addr in devices]}")
-
-        if 0x70 in devices:
-            print("✓ Display found at address 0x70")
-            return True
-        else:
-            print("✗ Display NOT found at address 0x70")
-            print("  Expected device at 0x70 (7-segment display)")
-            print("  Check your wiring:")
-            print("  - VIN (red) → Pi pin 2 (5V)")
-            print("  - IO (orange) → Pi pin 1 (3.3V) - REQUIRED")
-            print("  - GND (black) → Pi pin 6 (GND)")
-            print("  - SDA (yellow) → Pi pin 3 (GPIO 2)")
-            print("  - SCL (white) → Pi pin 5 (GPIO 3)")
-            print("  - Ensure all connections are secure")
-            return False
+        print("✗ Display NOT found at address 0x70")
+        print("  Expected device at 0x70 (7-segment display)")
+        print("  Check your wiring:")
+        print_wiring_help()
+        print("  - Ensure all connections are secure")
+        return False
 
     except OSError as e:
         if e.errno == 121:  # Remote I/O error
             print("✗ I2C Remote I/O error - device not responding")
             print("  This usually indicates a wiring problem")
             print("  Check your connections:")
-            print("  - VIN (red) → Pi pin 2 (5V)")
-            print("  - IO (orange) → Pi pin 1 (3.3V) - REQUIRED")
-            print("  - GND (black) → Pi pin 6 (GND)")
-            print("  - SDA (yellow) → Pi pin 3 (GPIO 2)")
-            print("  - SCL (white) → Pi pin 5 (GPIO 3)")
+            print_wiring_help()
         elif e.errno == 5:  # Input/output error
             print("✗ I2C Input/Output error")
             print("  Check I2C interface is enabled and user has permissions")
         else:
             print(f"✗ I2C communication error: {e}")
         return False
+    except (RuntimeError, ValueError) as e:  # Blinka: unsupported board or pins
+        print(f"✗ Cannot open I2C bus: {e}")
+        return False
     except Exception as e:
+        # First bus open happens here; anything else must still leave the
+        # clock running headless rather than crash startup
         print(f"✗ Unexpected error scanning I2C devices: {e}")
         return False
 
@@ -356,7 +650,7 @@ def initialize_display() -> bool:
     Returns:
         bool: True if display initialized successfully, False otherwise
     """
-    global display
+    global display, _display_device
 
     # First check hardware prerequisites
     if not check_hardware_prerequisites():
@@ -371,20 +665,24 @@ def initialize_display() -> bool:
     # Now attempt to initialize the display
     try:
         print("Initializing 7-segment display...")
-        i2c = busio.I2C(board.SCL, board.SDA)
-        display = segments.Seg7x4(i2c)
-        display.brightness = BRIGHTNESS
+        # Buffer edits are flushed explicitly with _fast_show()
+        display = segments.Seg7x4(_get_i2c(), auto_write=False)
+        _display_device = display.i2c_device
+        if isinstance(_display_device, list):  # ht16k33 >= 4.5 supports chaining
+            _display_device = _display_device[0]
+        display.brightness = CFG.brightness
         print(
-            f"✓ 7-segment display initialized successfully (brightness: {BRIGHTNESS})"
+            "✓ 7-segment display initialized successfully "
+            f"(brightness: {CFG.brightness})"
         )
 
         # Test the display with a simple message
         display.fill(0)
         display.print("INIT")
-        display.show()
+        _fast_show()
         time.sleep(1)
         display.fill(0)
-        display.show()
+        _fast_show()
 
         return True
 
@@ -404,11 +702,7 @@ def initialize_display() -> bool:
         if e.errno == 121:  # Remote I/O error
             print("✗ I2C Remote I/O error during display initialization")
             print("  Device not responding - check wiring:")
-            print("  - VIN (red) → Pi pin 2 (5V)")
-            print("  - IO (orange) → Pi pin 1 (3.3V) - REQUIRED")
-            print("  - GND (black) → Pi pin 6 (GND)")
-            print("  - SDA (yellow) → Pi pin 3 (GPIO 2)")
-            print("  - SCL (white) → Pi pin 5 (GPIO 3)")
+            print_wiring_help()
         elif e.errno == 5:  # Input/output error
             print("✗ I2C Input/Output error during display initialization")
             print("  Check I2C interface and permissions")
@@ -423,14 +717,15 @@ def initialize_display() -> bool:
 
 
 def initialize_ntp() -> bool:
-    """Initialize NTP client once.
+    """Open the SNTP client socket once.
 
     Returns:
         bool: True if NTP client initialized successfully, False otherwise
     """
-    global ntp_client
+    global ntp_socket
     try:
-        ntp_client = ntplib.NTPClient()
+        ntp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        ntp_socket.settimeout(NTP_TIMEOUT_SECS)
         print("✓ NTP client initialized successfully")
         return True
     except Exception as e:
@@ -439,23 +734,93 @@ def initialize_ntp() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def keep_alive_adapter_class() -> type:
+    """Build the HTTPAdapter subclass that enables TCP keep-alive.
+
+    Defined on first use, so requests is only imported once the HTTP session
+    is actually being set up.
+
+    Returns:
+        type: The KeepAliveAdapter class
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+
+    class KeepAliveAdapter(HTTPAdapter):
+        """HTTPAdapter that enables TCP keep-alive on its pooled sockets.
+
+        Keeping the OpenWeather connection warm avoids a fresh TCP + TLS
+        handshake on every refresh, which is noticeable on a Pi Zero's CPU.
+        """
+
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+            super().init_poolmanager(*args, **kwargs)
+
+    return KeepAliveAdapter
+
+
+def build_weather_url() -> str:
+    """Build the full OpenWeather request URL from the frozen config.
+
+    Returns:
+        str: Endpoint URL with the zip/appid/units query already encoded
+    """
+    query = urlencode({"zip": CFG.zip_code, "appid": CFG.api_key, "units": "metric"})
+    return f"{API_ENDPOINT}?{query}"
+
+
 def initialize_http_session() -> bool:
-    """Initialize a reusable HTTP session and prebuild request params.
+    """Initialize a reusable HTTP session and prebuild the request URL.
 
     Returns:
         bool: True if HTTP session initialized successfully, False otherwise
     """
-    global SESSION, WEATHER_PARAMS
+    global SESSION, WEATHER_URL
     try:
+        # Deferred: requests pulls in urllib3, idna and charset_normalizer,
+        # which would otherwise hold up the display coming up at startup
+        import requests
+        from urllib3.util.retry import Retry
+
+        # HTTP/1.1 keep-alive is enough here: one small GET per refresh gives
+        # HTTP/2 multiplexing nothing to share a connection with
         SESSION = requests.Session()
-        WEATHER_PARAMS = {"zip": ZIP_CODE, "appid": API_KEY, "units": "metric"}
+        # Single-host client: one pool, at most two sockets. urllib3 retries
+        # server errors with backoff; connect/read failures are left to the
+        # retry loop in fetch_weather() so attempts don't multiply.
+        retry = Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=2,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = keep_alive_adapter_class()(
+            pool_connections=1, pool_maxsize=2, max_retries=retry
+        )
+        SESSION.mount("https://", adapter)
+        SESSION.headers.update(
+            {
+                "Connection": "keep-alive",
+                "User-Agent": "rpi-clock/1.0",
+                "Accept-Encoding": "gzip",
+            }
+        )
+        WEATHER_URL = build_weather_url()
         print("✓ HTTP session initialized successfully")
         return True
     except Exception as e:
         print(f"✗ HTTP session initialization failed: {e}")
         print("  Weather functionality will be limited")
         SESSION = None
-        WEATHER_PARAMS = None
+        WEATHER_URL = None
         return False
 
 
@@ -478,15 +843,181 @@ def write_display(text: str) -> None:
         text: Text to display on the 7-segment display
     """
     global last_display_text
+    if not display or text is last_display_text:
+        return
+    if text == last_display_text:
+        # Equal but a different object: adopt it so the next call hits `is`
+        last_display_text = text
+        return
+    try:
+        # Prebuilt frame instead of Seg7x4.print(); the colon is driven
+        # separately by set_colon(), so carry its current state over
+        colon = display._buffer[COLON_REGISTER + 1]
+        display._buffer[:] = _text_frame(text)
+        display._buffer[COLON_REGISTER + 1] = colon
+        _fast_show()
+        last_display_text = text
+    except Exception as e:
+        print(f"✗ Display write error: {e}")
+
+
+def _fast_show() -> None:
+    """Push the display buffer to the HT16K33 in one I2C write.
+
+    Seg7x4.show() slices a fresh copy of the buffer for each chained device
+    on every call and sends all 16 RAM bytes. This clock drives a single
+    display, so the live buffer is written in place, only up to the last
+    RAM address the Seg7x4 uses, and only when it differs from the last
+    frame sent.
+    """
     if not display:
         return
-    if text != last_display_text:
-        try:
-            display.print(text)
-            display.show()
-            last_display_text = text
-        except Exception as e:
-            print(f"✗ Display write error: {e}")
+    buffer = display._buffer
+    if buffer == _last_flushed:
+        return
+    with _display_device:
+        _display_device.write(buffer, end=FRAME_WRITE_LEN)
+    _last_flushed[:] = buffer
+
+
+def _segment_byte(char: str) -> int:
+    """Look up the 7-segment bitmask for one character, as Seg7x4 renders it.
+
+    Args:
+        char: Single character to render
+
+    Returns:
+        int: Segment bitmask, 0 (blank) for unsupported characters
+    """
+    char = char.lower()
+    if "a" <= char <= "y":
+        return int(segments.NUMBERS[ord(char) - 97 + 10])
+    if "0" <= char <= "9":
+        return int(segments.NUMBERS[ord(char) - 48])
+    if char == "-":
+        return int(segments.NUMBERS[36])
+    return 0x00
+
+
+def _render_frames(text: str) -> Tuple[bytes, ...]:
+    """Render the display frames for pushing text onto a blank display.
+
+    Mirrors Seg7x4's text handling: every character shifts in from the right,
+    a '.' lights the decimal point of the previous character without taking
+    a step, and ':'/';' switch the colon on/off. Each frame is a complete
+    17-byte write (RAM address prefix + 16 data bytes).
+
+    Args:
+        text: Text to render
+
+    Returns:
+        Tuple[bytes, ...]: One frame per scroll step
+    """
+    cells = [0x00, 0x00, 0x00, 0x00]
+    colon = 0x00
+    frames: List[bytes] = []
+    for char in text:
+        step = True
+        if char == "." and not cells[-1] & DECIMAL_POINT:
+            cells[-1] |= DECIMAL_POINT
+            step = not frames
+        elif char in ":;":
+            colon = COLON_ON if char == ":" else 0x00
+        elif char == ".":
+            cells = cells[1:] + [DECIMAL_POINT]
+        else:
+            cells = cells[1:] + [_segment_byte(char)]
+
+        frame = bytearray(17)
+        for register, cell in zip(DIGIT_REGISTERS, cells):
+            frame[register + 1] = cell
+        frame[COLON_REGISTER + 1] = colon
+        if step:
+            frames.append(bytes(frame))
+        else:
+            frames[-1] = bytes(frame)
+    return tuple(frames)
+
+
+@functools.lru_cache(maxsize=32)
+def _marquee_frames(text: str) -> Tuple[bytes, ...]:
+    """Frames for scrolling text once across the display.
+
+    Cached, since the same labels and readings scroll every cycle.
+
+    Args:
+        text: Text to scroll
+
+    Returns:
+        Tuple[bytes, ...]: One frame per scroll step
+    """
+    return _render_frames(text)
+
+
+@functools.lru_cache(maxsize=2048)
+def _text_frame(text: str) -> bytes:
+    """Frame showing static (up to 4-character) text.
+
+    Sized to hold a full day of 24-hour clock strings plus the temperature
+    and humidity readings, so steady-state redraws never touch the font.
+
+    Args:
+        text: Text to show
+
+    Returns:
+        bytes: Complete 17-byte display frame
+    """
+    frames = _render_frames(text)
+    return frames[-1] if frames else bytes(17)
+
+
+def _marquee(text: str, delay: float) -> None:
+    """Scroll text once across the display from prebuilt frames.
+
+    Replaces Seg7x4.marquee(), which re-renders the buffer through the font
+    lookup on every step and busy-polls the clock between steps.
+
+    Args:
+        text: Text to scroll
+        delay: Delay between scroll steps in seconds
+    """
+    if not display:
+        return
+    for frame in _marquee_frames(text):
+        display._buffer[:] = frame  # keep the library's buffer in step
+        _fast_show()
+        if _shutdown.wait(delay):
+            return
+
+
+def set_colon(on: bool) -> None:
+    """Switch the colon on or off with a single-register I2C write.
+
+    Seg7x4's colon setter resends the whole 16-byte frame even though only the
+    colon register changes. Writing just that register cuts the 1 Hz blink
+    traffic to two bytes, and nothing is sent if the colon is already set.
+    The neighbouring register 0x05 is unused on the Seg7x4 and stays zero,
+    so it never needs rewriting.
+
+    Args:
+        on: True to light the colon
+    """
+    if not display:
+        return
+    command = COLON_ON_WRITE if on else COLON_OFF_WRITE
+    # Byte 0 of the library buffer is the RAM address prefix
+    buffer = display._buffer
+    if buffer[COLON_REGISTER + 1] == command[1]:
+        return
+    # Keep the library's buffer in step so later full-frame writes agree
+    buffer[COLON_REGISTER + 1] = command[1]
+    try:
+        with _display_device:
+            _display_device.write(command)
+        if _last_flushed:
+            _last_flushed[COLON_REGISTER + 1] = command[1]
+    except Exception as e:
+        print(f"✗ Display write error: {e}")
 
 
 def build_temp_string(temp: float, unit: str) -> str:
@@ -499,12 +1030,11 @@ def build_temp_string(temp: float, unit: str) -> str:
     Returns:
         str: Formatted temperature string
     """
-    if temp < 0:
-        abs_temp = abs(temp)
-        if abs_temp < 1.0:
-            return f"0{unit}"
-        return f"-{int(abs_temp)}{unit}"
-    return f"{int(temp)}{unit}"
+    whole = int(temp)  # Truncates toward zero, so -0.4 shows as 0
+    table = TEMP_STRINGS.get(unit)
+    if table is not None and TEMP_TABLE_MIN <= whole <= TEMP_TABLE_MAX:
+        return table[whole - TEMP_TABLE_MIN]
+    return f"{whole}{unit}"
 
 
 def display_temperature(temp: float, unit: str) -> None:
@@ -516,26 +1046,25 @@ def display_temperature(temp: float, unit: str) -> None:
     """
     if not display:
         return
-    temp_str = build_temp_string(temp, unit)
-    # Ensure we don't exceed 4 characters
-    if len(temp_str) > 4:
-        temp_str = temp_str[:4]
-    write_display(temp_str.rjust(4))
+    # Truncation means the integer part fully determines the output
+    whole = int(temp)
+    table = TEMP_DISPLAY_STRINGS.get(unit)
+    if table is not None and TEMP_TABLE_MIN <= whole <= TEMP_TABLE_MAX:
+        write_display(table[whole - TEMP_TABLE_MIN])
+    else:
+        # Ensure we don't exceed 4 characters
+        write_display(build_temp_string(temp, unit)[:4].rjust(4))
 
 
 def display_time() -> None:
-    """Display time with optimized formatting."""
+    """Display time using the precomputed hour/minute strings."""
     if not display:
         return
 
-    now = time.localtime()
-    hour = now.tm_hour
-    if TIME_FORMAT == "12":
-        hour = hour % 12 or 12  # More efficient than if/else
-    minute = now.tm_min
-
-    # Use format string for better performance
-    write_display(f"{hour:2d}{minute:02d}")
+    now = get_current_time()
+    # Interned, so an unchanged minute yields the very same string object and
+    # write_display() can skip it on identity alone
+    write_display(sys.intern(HOUR_TABLE[now.tm_hour] + MINUTE_STR[now.tm_min]))
 
 
 def display_humidity(humidity: float) -> None:
@@ -549,7 +1078,11 @@ def display_humidity(humidity: float) -> None:
 
     # Show humidity with "rH" prefix (e.g., "rH50" for 50% humidity)
     # Since 7-segment display can't show '%', we use "rH" to indicate relative humidity
-    write_display(f"rH{int(round(humidity)):02d}")
+    percent = int(round(humidity))
+    if 0 <= percent <= 100:
+        write_display(HUMIDITY_STRINGS[percent])
+    else:
+        write_display(f"rH{percent:02d}")
 
 
 def scroll_combined_label_value(
@@ -568,57 +1101,113 @@ def scroll_combined_label_value(
         return
     # Compose with padding at end to allow scroll-off
     full_text = f"{label} {value_text}   "
-    display.fill(0)
-    display.marquee(full_text, delay=delay, loop=False)
+    _marquee(full_text, delay)
     # Invalidate cache since marquee wrote directly to display
     global last_display_text
     last_display_text = None
 
 
+def parse_cache_ttl(headers: Any) -> Optional[int]:
+    """Extract the freshness lifetime from HTTP caching headers.
+
+    Cache-Control max-age takes precedence over Expires, as in RFC 9111.
+
+    Args:
+        headers: Response headers mapping
+
+    Returns:
+        Optional[int]: Lifetime in seconds, or None if the server sent none
+    """
+    match = MAX_AGE_RE.search(headers.get("Cache-Control") or "")
+    if match:
+        return int(match.group(1))
+
+    expires = headers.get("Expires")
+    if not expires:
+        return None
+    try:
+        expires_at = parsedate_to_datetime(expires).timestamp()
+        date = headers.get("Date")
+        now = parsedate_to_datetime(date).timestamp() if date else time.time()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0, int(expires_at - now))
+
+
+def retry_backoff(attempt: int) -> float:
+    """Compute the wait before retrying a failed weather request.
+
+    Exponential backoff with up to one second of random jitter, so retries
+    recover quickly from brief blips without hitting the API in lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+
+    Returns:
+        float: Seconds to sleep before the next attempt
+    """
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2.0**attempt) + random.uniform(0, 1)
+
+
 def fetch_weather() -> Optional[Tuple[float, float, int]]:
     """Fetch weather with optimized retry logic.
 
+    Revalidates with If-None-Match/If-Modified-Since when the last response
+    carried validators; a 304 returns that reading without a body or parse.
+    Also records the server-provided freshness lifetime in weather_ttl.
+
     Returns:
         Optional[Tuple[int, int, int]]: (temperature, feels_like, humidity) or None
     """
+    global weather_ttl, _weather_etag, _weather_last_modified, _weather_validated
     max_retries = 3
-    retry_delay = 5
 
-    # Use prebuilt params and session
-    params = WEATHER_PARAMS
+    try:
+        # Already loaded by initialize_http_session(); just a sys.modules hit
+        import requests
+        from urllib3.exceptions import HTTPError as UrllibHTTPError
+    except ImportError:
+        print("✗ requests is not installed - weather unavailable")
+        return None
+
+    # Use the prebuilt URL and session; the query never changes at runtime
+    url = WEATHER_URL or build_weather_url()
+
+    headers: Dict[str, str] = {}
+    if _weather_validated is not None:
+        if _weather_etag:
+            headers["If-None-Match"] = _weather_etag
+        if _weather_last_modified:
+            headers["If-Modified-Since"] = _weather_last_modified
 
     for attempt in range(max_retries):
         try:
+            # Stream the body so at most WEATHER_MAX_BODY_BYTES (+1 to detect
+            # overflow) is ever buffered, whatever the server sends
             if SESSION is None:
-                response = requests.get(API_ENDPOINT, params=params, timeout=10)
+                response = requests.get(
+                    url, headers=headers, timeout=10, stream=True
+                )
             else:
-                response = SESSION.get(API_ENDPOINT, params=params, timeout=10)
-            response.raise_for_status()
-            weather_data = response.json()
-
-            # Extract data once; keep floats through unit conversion so
-            # celsius_to_fahrenheit receives precise values, not pre-rounded ints
-            main_data = weather_data["main"]
-            temperature: float = float(main_data["temp"])
-            feels_like: float = float(main_data["feels_like"])
-            
-            humidity_raw = main_data.get("humidity")
-            if humidity_raw is None:
-                print("✗ Weather data missing humidity field")
-                return None
-            humidity: int = int(round(humidity_raw))
-
-            # Convert units if needed
-            if TEMP_UNIT == "F":
-                temperature = celsius_to_fahrenheit(temperature)
-                feels_like = celsius_to_fahrenheit(feels_like)
-
-            return temperature, feels_like, humidity
-
+                response = SESSION.get(url, headers=headers, timeout=10, stream=True)
+            try:
+                # Read before checking the status: a 304 or error body is
+                # empty or short, and reaching its end is what lets urllib3
+                # return the connection to the keep-alive pool. close() on an
+                # unread body drops the socket instead.
+                body = response.raw.read(
+                    WEATHER_MAX_BODY_BYTES + 1, decode_content=True
+                )
+                response.raise_for_status()
+                if response.status_code == 304 and _weather_validated is not None:
+                    body = None  # Not modified: keep the validated reading
+            finally:
+                response.close()
+            break
         except requests.exceptions.Timeout:
             print(f"✗ Weather API timeout (attempt {attempt + 1}/{max_retries})")
             if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+                time.sleep(retry_backoff(attempt))
             else:
                 print("  Weather data unavailable - check internet connection")
                 return None
@@ -628,7 +1217,7 @@ def fetch_weather() -> Optional[Tuple[float, float, int]]:
                 f"(attempt {attempt + 1}/{max_retries})"
             )
             if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+                time.sleep(retry_backoff(attempt))
             else:
                 print("  Weather data unavailable - check internet connection")
                 return None
@@ -640,35 +1229,242 @@ def fetch_weather() -> Optional[Tuple[float, float, int]]:
             else:
                 print(f"✗ Weather API HTTP error: {e}")
             return None
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, UrllibHTTPError) as e:
+            # raw.read() raises urllib3 errors directly, unwrapped by requests
             print(f"✗ Weather API request error: {e}")
             if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+                time.sleep(retry_backoff(attempt))
             else:
                 return None
-        except (KeyError, ValueError, TypeError) as e:
-            print(f"✗ Weather data parsing error: {e}")
-            print("  Weather API response format may have changed")
+    else:
+        return None
+
+    if body is None:
+        weather_ttl = parse_cache_ttl(response.headers)
+        return _weather_validated
+
+    if len(body) > WEATHER_MAX_BODY_BYTES:
+        print(f"✗ Weather API response too large (>{WEATHER_MAX_BODY_BYTES} bytes)")
+        return None
+
+    # Parse and convert once, outside the retry loop - a malformed body is
+    # not worth retrying, since the data won't fix itself
+    try:
+        main_data = json_loads(body)["main"]
+        temperature: float = float(main_data["temp"])
+        feels_like: float = float(main_data["feels_like"])
+
+        humidity_raw = main_data.get("humidity")
+        if humidity_raw is None:
+            print("✗ Weather data missing humidity field")
             return None
-    return None
+        humidity: int = int(round(humidity_raw))
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"✗ Weather data parsing error: {e}")
+        print("  Weather API response format may have changed")
+        return None
+
+    # Convert both readings in one step; keep floats so the display's
+    # truncation sees precise values, not pre-rounded ints
+    if CFG.temp_unit == "F":
+        temperature, feels_like = (
+            temperature * C_TO_F_FACTOR + 32,
+            feels_like * C_TO_F_FACTOR + 32,
+        )
 
+    weather_ttl = parse_cache_ttl(response.headers)
+    _weather_etag = response.headers.get("ETag")
+    _weather_last_modified = response.headers.get("Last-Modified")
+    _weather_validated = (temperature, feels_like, humidity)
+    return _weather_validated
 
-def get_current_time() -> time.struct_time:
-    """Get current time with cached NTP client.
+
+def _refresh_worker() -> None:
+    """Fetch weather in the background and update the cache on success.
+
+    On failure the previous (stale) reading is kept so the display keeps
+    showing the last known values rather than going blank, but only for
+    WEATHER_STALE_IF_ERROR_INTERVALS refresh intervals past its expiry. The
+    next attempt is pushed back by at least one refresh interval.
+    """
+    global cached_weather_info, weather_expires_at, weather_stale_at
+    global _weather_failures, _refresh_inflight
+    try:
+        result = fetch_weather()
+        now = time.monotonic()
+        if result is None:
+            with _refresh_lock:
+                if cached_weather_info is not None and now > weather_stale_at:
+                    print("✗ Weather data is too old - hidden until a fetch succeeds")
+                    cached_weather_info = None
+                # fetch_weather() has already retried; wait for a later cycle
+                doublings = min(_weather_failures, WEATHER_FAILURE_MAX_DOUBLINGS)
+                weather_expires_at = now + CFG.weather_refresh_secs * 2**doublings
+                _weather_failures += 1
+        else:
+            # A server freshness lifetime may stretch the configured refresh
+            # interval but never shorten it: refresh_minutes is what keeps
+            # the clock inside the API's daily call quota
+            ttl = max(weather_ttl or 0, CFG.weather_refresh_secs)
+            stale_grace = WEATHER_STALE_IF_ERROR_INTERVALS * CFG.weather_refresh_secs
+            with _refresh_lock:
+                cached_weather_info = result
+                weather_expires_at = now + ttl
+                weather_stale_at = weather_expires_at + stale_grace
+                _weather_failures = 0
+    finally:
+        with _refresh_lock:
+            _refresh_inflight = False
+
+
+def _maybe_refresh_weather_async() -> None:
+    """Start a background weather refresh if the cache is stale.
+
+    Never blocks the caller: the display loop keeps serving the cached reading
+    while the refresh (including any retries) runs on a daemon thread.
+    """
+    global _refresh_inflight
+    with _refresh_lock:
+        if _refresh_inflight:
+            return
+        if time.monotonic() < weather_expires_at:
+            return
+        _refresh_inflight = True
+    try:
+        threading.Thread(target=_refresh_worker, daemon=True).start()
+    except Exception as e:
+        print(f"✗ Could not start weather refresh thread: {e}")
+        with _refresh_lock:
+            _refresh_inflight = False
+
+
+def _ntp_timestamp(data: bytes, offset: int) -> float:
+    """Decode a 64-bit NTP timestamp from a packet as Unix seconds.
+
+    Args:
+        data: NTP packet
+        offset: Byte offset of the timestamp
 
     Returns:
-        time.struct_time: Current time structure
+        float: Seconds since the Unix epoch
+    """
+    seconds, fraction = struct.unpack_from("!II", data, offset)
+    return float(seconds - NTP_EPOCH_OFFSET + fraction / 2**32)
+
+
+def sntp_query_offset(sock: socket.socket, host: str) -> float:
+    """Ask an NTP server for the local clock offset with one SNTP exchange.
+
+    The request carries our transmit time, which the server echoes back as
+    the originate timestamp; replies that don't echo it (late answers to an
+    earlier, timed-out query) are discarded.
+
+    Args:
+        sock: UDP socket with a timeout set
+        host: NTP server name or address
+
+    Returns:
+        float: Seconds to add to time.time() to match the server
+
+    Raises:
+        OSError: On socket errors, including timeouts
+        ValueError: On a malformed or refused reply
+    """
+    t1 = time.time()
+    tx = t1 + NTP_EPOCH_OFFSET
+    stamp = struct.pack("!II", int(tx), int(tx % 1 * 2**32))
+    sock.sendto(NTP_REQUEST_HEADER + stamp, (host, NTP_PORT))
+    for _ in range(4):
+        data, _ = sock.recvfrom(NTP_PACKET_LEN)
+        t4 = time.time()
+        if len(data) == NTP_PACKET_LEN and data[24:32] == stamp:
+            break
+    else:
+        raise ValueError("no matching NTP reply")
+    if data[1] == 0:
+        raise ValueError("NTP server refused the query (kiss-of-death)")
+    t2 = _ntp_timestamp(data, 32)  # server receive
+    t3 = _ntp_timestamp(data, 40)  # server transmit
+    return ((t2 - t1) + (t3 - t4)) / 2
+
+
+def sync_ntp_offset() -> bool:
+    """Query the NTP server once and cache the local clock offset.
+
+    A failure is reported once, when syncing starts failing, and again when
+    it recovers, so an unreachable server does not fill the journal.
+
+    Returns:
+        bool: True if the offset was updated, False otherwise
+    """
+    global ntp_offset, last_ntp_sync, _ntp_failing
+    if not ntp_socket:
+        return False
+    try:
+        offset = sntp_query_offset(ntp_socket, CFG.preferred_ntp_server)
+    except (OSError, ValueError) as e:
+        if not _ntp_failing:
+            print(f"✗ NTP synchronization failed: {e}")
+            print("  Using the last known offset - check GPS/NTP configuration")
+        _ntp_failing = True
+        return False
+    except Exception as e:
+        if not _ntp_failing:
+            print(f"✗ Time synchronization error: {e}")
+        _ntp_failing = True
+        return False
+    if _ntp_failing:
+        print("✓ NTP synchronization restored")
+    _ntp_failing = False
+    ntp_offset = offset
+    last_ntp_sync = time.monotonic()
+    return True
+
+
+def _ntp_refresher() -> None:
+    """Keep the cached NTP offset fresh until shutdown (runs in a daemon thread)."""
+    while not _shutdown.is_set():
+        sync_ntp_offset()
+        if _shutdown.wait(NTP_SYNC_INTERVAL_SECS):
+            return
+
+
+def start_ntp_refresher() -> bool:
+    """Start the background NTP refresher thread.
+
+    Returns:
+        bool: True if the thread was started, False otherwise
     """
+    if not ntp_socket:
+        return False
     try:
-        if ntp_client:
-            response = ntp_client.request(PREFERRED_NTP_SERVER, version=4, timeout=5)
-            return time.localtime(response.tx_time)
-    except ntplib.NTPException as e:
-        print(f"✗ NTP synchronization failed: {e}")
-        print("  Using system time - check GPS/NTP configuration")
+        threading.Thread(
+            target=_ntp_refresher, name="ntp-refresher", daemon=True
+        ).start()
+        return True
     except Exception as e:
-        print(f"✗ Time synchronization error: {e}")
-    return time.localtime()
+        print(f"✗ Could not start NTP sync thread: {e}")
+        return False
+
+
+def get_current_time() -> time.struct_time:
+    """Get current time from the local clock corrected by the cached NTP offset.
+
+    Never waits on the network; the offset is kept fresh by _ntp_refresher().
+
+    Returns:
+        time.struct_time: Current time structure
+    """
+    return time.localtime(time.time() + ntp_offset)
+
+
+def corrected_time_ns() -> int:
+    """Get the NTP-corrected wall-clock time as integer nanoseconds.
+
+    Returns:
+        int: time.time_ns() plus the cached NTP offset
+    """
+    return time.time_ns() + round(ntp_offset * NS_PER_SEC)
 
 
 def display_metric_with_message(
@@ -685,9 +1481,8 @@ def display_metric_with_message(
     if not display:
         return
 
-    display.fill(0)
-    display.marquee(message, delay=0.2, loop=False)
-    time.sleep(delay)
+    _marquee(message, 0.2)
+    _shutdown.wait(delay)
     # Marquee changed the display buffer; invalidate cache so next write isn't skipped
     global last_display_text
     last_display_text = None
@@ -701,22 +1496,21 @@ def display_custom_text() -> None:
     Uses the configured custom text and scrolls it across the display
     for the configured duration. Respects the smooth_scroll setting.
     """
-    if not display or not CUSTOM_TEXT_ENABLED or not CUSTOM_TEXT.strip():
+    if not display or not CFG.custom_text_enabled or not CFG.custom_text.strip():
         return
 
-    print(f"Displaying custom text: {CUSTOM_TEXT}")
+    print(f"Displaying custom text: {CFG.custom_text}")
 
-    if SMOOTH_SCROLL:
+    if CFG.smooth_scroll:
         # Use smooth scrolling with marquee
-        display.fill(0)
-        text_to_display = CUSTOM_TEXT[:20]  # Hard limit for display
-        display.marquee(text_to_display, delay=SCROLL_DELAY, loop=False)
+        text_to_display = CFG.custom_text[:20]  # Hard limit for display
+        _marquee(text_to_display, SCROLL_DELAY)
     else:
         # Use static display for the configured duration
-        write_display(CUSTOM_TEXT[:4])  # Show first 4 characters
+        write_display(CFG.custom_text[:4])  # Show first 4 characters
 
     # Wait for the configured duration
-    time.sleep(CUSTOM_TEXT_DURATION)
+    _shutdown.wait(CFG.custom_text_duration)
 
     # Invalidate cache since marquee wrote directly to display
     global last_display_text
@@ -729,7 +1523,7 @@ def should_display_custom_text() -> bool:
     Returns:
         bool: True if custom text should be displayed, False otherwise
     """
-    if not CUSTOM_TEXT_ENABLED or not CUSTOM_TEXT.strip():
+    if not CFG.custom_text_enabled or not CFG.custom_text.strip():
         return False
 
     global last_custom_text_time
@@ -741,99 +1535,154 @@ def should_display_custom_text() -> bool:
         return True
 
     # Check if enough time has passed
-    if current_time - last_custom_text_time >= CUSTOM_TEXT_INTERVAL_SECONDS:
+    if current_time - last_custom_text_time >= CFG.custom_text_interval_secs:
         last_custom_text_time = current_time
         return True
 
     return False
 
 
-def main_loop() -> None:
-    """Optimized main loop with reduced function calls."""
-    last_weather_fetch: float = 0.0
-    global cached_weather_info
+# (display function, builder of its args from the readings, pause afterwards)
+DisplayStep = Tuple[
+    Callable[..., None], Callable[[float, float, int], Tuple[Any, ...]], float
+]
+
+
+def build_display_steps(cfg: Optional[Cfg] = None) -> List[DisplayStep]:
+    """Resolve the weather display sequence once from the frozen config.
+
+    Args:
+        cfg: Configuration snapshot; defaults to CFG
+
+    Returns:
+        List[DisplayStep]: Steps to run, in order, for every weather cycle
+    """
+    cfg = cfg or CFG
+    unit = cfg.temp_unit
+    if cfg.smooth_scroll:
+        # Scroll label + value together for a ticker feel
+        return [
+            (
+                scroll_combined_label_value,
+                lambda t, f, h: ("Out", build_temp_string(t, unit)),
+                0,
+            ),
+            (
+                scroll_combined_label_value,
+                lambda t, f, h: ("FEEL", build_temp_string(f, unit)),
+                0,
+            ),
+            (
+                scroll_combined_label_value,
+                lambda t, f, h: ("rH", f"{int(round(h)):02d}"),
+                0,
+            ),
+        ]
+    # Original stepwise messaging
+    return [
+        (
+            display_metric_with_message,
+            lambda t, f, h: ("Out", display_temperature, t, unit),
+            cfg.temp_display,
+        ),
+        (
+            display_metric_with_message,
+            lambda t, f, h: ("feel", display_temperature, f, unit),
+            cfg.feels_like_display,
+        ),
+        (display_humidity, lambda t, f, h: (h,), cfg.humidity_display),
+    ]
+
+
+def main_loop(cfg: Optional[Cfg] = None) -> None:
+    """Optimized main loop with reduced function calls.
+
+    Args:
+        cfg: Configuration snapshot, bound as a local; defaults to CFG
+    """
+    cfg = cfg or CFG
+    # Hot-path callables as locals: LOAD_FAST instead of global/attr lookups
+    wait = _shutdown.wait
+    is_set = _shutdown.is_set
+    time_ns = corrected_time_ns  # Same clock display_time() renders
+    monotonic_ns = time.monotonic_ns
 
     if not display:
         print("⚠  Running without display - logging weather/time to console only")
 
-    while True:
+    # SMOOTH_SCROLL can't change at runtime, so choose the display path once
+    steps = build_display_steps(cfg)
+
+    # Start the first fetch now, so it runs alongside the first time phase
+    # and the first weather cycle has a reading to show
+    _maybe_refresh_weather_async()
+
+    while not is_set():
         try:
             # Time display loop - optimized with monotonic tick and cached redraws
-            total_seconds = TIME_DISPLAY * 2  # preserve original semantics
+            total_seconds = cfg.time_display * 2  # preserve original semantics
 
-            # Initial render and minute cache
-            now_struct = time.localtime()
-            global last_time_minute
-            last_time_minute = now_struct.tm_min
+            # Initial render; track the epoch minute shown so the tick only
+            # needs an integer division, not a full localtime() call. Snapshot
+            # before rendering: a rollover in between then forces a redraw.
+            shown_minute = time_ns() // NS_PER_MIN
             display_time()
 
             seconds_elapsed = 0
             colon_on = False
-            next_tick = time.monotonic()
-            while seconds_elapsed < total_seconds:
+            # Phase-lock the ticks to wall-clock second boundaries, so the
+            # minute rollover lands on a tick instead of up to a second late.
+            # Integer nanoseconds keep the schedule exact over long uptimes.
+            next_tick = monotonic_ns() - time_ns() % NS_PER_SEC
+            while seconds_elapsed < total_seconds and not is_set():
                 colon_on = not colon_on
-                if display:
-                    display.colon = colon_on
-                    display.show()
-
-                # Update time at minute change without redrawing otherwise
-                now_struct = time.localtime()
-                if now_struct.tm_min != last_time_minute:
-                    last_time_minute = now_struct.tm_min
+                set_colon(colon_on)
+
+                # Redraw on any minute change - including a step backwards when
+                # chrony corrects the clock, which a ">= next boundary" check
+                # would sit out until the clock caught up again
+                now_minute = time_ns() // NS_PER_MIN
+                if now_minute != shown_minute:
+                    shown_minute = now_minute
                     display_time()
 
-                next_tick += 1.0
-                sleep_duration = next_tick - time.monotonic()
-                if sleep_duration > 0:
-                    time.sleep(sleep_duration)
+                next_tick += NS_PER_SEC
+                delta = next_tick - monotonic_ns()
+                if delta > 0 and wait(delta / NS_PER_SEC):
+                    return
                 seconds_elapsed += 1
 
+            if is_set():
+                return
+
             # Check if custom text should be displayed
             if should_display_custom_text():
                 display_custom_text()
 
-            # Weather display - fetch on first run or after refresh interval
-            now_mono = time.monotonic()
-            if cached_weather_info is None or (now_mono - last_weather_fetch) >= WEATHER_REFRESH_SECS:
-                cached_weather_info = fetch_weather()
-                last_weather_fetch = now_mono
+            # Weather display - refresh in the background, show cached data now
+            _maybe_refresh_weather_async()
+            with _refresh_lock:
+                weather_info = cached_weather_info
 
-            if cached_weather_info:
-                temperature, feels_like, humidity = cached_weather_info
+            if weather_info:
+                temperature, feels_like, humidity = weather_info
 
                 if not display:
                     now_str = time.strftime(
-                        "%I:%M %p" if TIME_FORMAT == "12" else "%H:%M"
+                        "%I:%M %p" if cfg.time_format == "12" else "%H:%M",
+                        get_current_time(),
                     )
                     print(
                         f"[{now_str}] "
-                        f"Temp: {int(temperature)}{TEMP_UNIT}  "
-                        f"Feels: {int(feels_like)}{TEMP_UNIT}  "
+                        f"Temp: {int(temperature)}{cfg.temp_unit}  "
+                        f"Feels: {int(feels_like)}{cfg.temp_unit}  "
                         f"Humidity: {int(round(humidity))}%"
                     )
 
-                if SMOOTH_SCROLL:
-                    # Scroll label + value together for a ticker feel
-                    scroll_combined_label_value(
-                        "Out", build_temp_string(temperature, TEMP_UNIT)
-                    )
-                    scroll_combined_label_value(
-                        "FEEL", build_temp_string(feels_like, TEMP_UNIT)
-                    )
-                    scroll_combined_label_value("rH", f"{int(round(humidity)):02d}")
-                else:
-                    # Original stepwise messaging
-                    display_metric_with_message(
-                        "Out", display_temperature, temperature, TEMP_UNIT
-                    )
-                    time.sleep(TEMP_DISPLAY)
-                    display_metric_with_message(
-                        "feel", display_temperature, feels_like, TEMP_UNIT
-                    )
-                    time.sleep(FEELS_LIKE_DISPLAY)
-                    display_humidity(humidity)
-                    time.sleep(HUMIDITY_DISPLAY)
-
+                for step_fn, build_args, post_delay in steps:
+                    step_fn(*build_args(temperature, feels_like, humidity))
+                    if post_delay and wait(post_delay):
+                        return
 
         except KeyboardInterrupt:
             print("\nReceived interrupt signal - shutting down gracefully")
@@ -841,7 +1690,8 @@ def main_loop() -> None:
         except Exception as e:
             print(f"✗ Unexpected error in main loop: {e}")
             print("  Continuing operation - check system logs for details")
-            time.sleep(5)
+            if wait(5):
+                return
 
 
 if __name__ == "__main__":
@@ -849,12 +1699,13 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    print("RPI-Clock: GPS-synchronized timekeeper with weather display")
-    print("=" * 60)
+    print("RPI-Clock: GPS-synchronized timekeeper with weather display\n" + "=" * 60)
 
     # Initialize components with proper error handling
     display_ok = initialize_display()
     ntp_ok = initialize_ntp()
+    if ntp_ok:
+        start_ntp_refresher()
     http_ok = initialize_http_session()
 
     # Warn about non-critical failures
@@ -868,15 +1719,16 @@ if __name__ == "__main__":
     if not http_ok:
         warnings.append("HTTP session failed - weather data may be unavailable")
 
+    # Assemble the summary and emit it as one write; the service runs with -u
     if warnings:
-        print("\n⚠️  Warnings:")
-        for warning in warnings:
-            print(f"  - {warning}")
-        print("  Clock will continue with limited functionality")
+        summary = [
+            "\n⚠️  Warnings:",
+            *(f"  - {warning}" for warning in warnings),
+            "  Clock will continue with limited functionality",
+        ]
     else:
-        print("\n✓ All components initialized successfully")
-
-    print("Starting Raspberry Pi Clock...")
-    print("=" * 60)
+        summary = ["\n✓ All components initialized successfully"]
+    summary += ["Starting Raspberry Pi Clock...", "=" * 60]
+    print("\n".join(summary))
 
-    main_loop()
+    main_loop(CFG)
@@ -118,11 +118,18 @@ def main() -> None:
     waiting_for_fix: bool = True
 
     while running:
+        # readline() blocks in the kernel until gpsd sends a full sentence
         line = proc.stdout.readline()
         if not line:
-            if proc.poll() is not None:
-                print("✗ gpspipe process ended unexpectedly")
-                break
+            # EOF only happens once gpspipe has closed its stdout; block on
+            # its exit rather than spinning on poll() until it's reaped
+            proc.wait()
+            print("✗ gpspipe process ended unexpectedly")
+            break
+
+        # Skip SKY/DEVICE/etc. reports (SKY carries the whole satellite
+        # list) before paying for a JSON parse
+        if '"TPV"' not in line:
             continue
 
         try:
@@ -127,12 +127,13 @@ echo ""
 echo "Step 7: Testing GPS time synchronization..."
 echo "------------------------------------------"
 if command_exists gpspipe; then
-    echo "Testing GPS time data (timeout: 5 seconds)..."
-    timeout 5 gpspipe -r 2>/dev/null | grep -E "TPV|TIME" | head -5
-    if [[ ${PIPESTATUS[0]} -eq 124 ]]; then
-        echo "✗ GPS time data timeout"
-    else
+    echo "Waiting for a valid GPS time sentence (timeout: 5 seconds)..."
+    # Raw NMEA: stop at the first RMC with status A (valid fix), rather than
+    # always sitting out the whole timeout
+    if timeout 5 gpspipe -r 2>/dev/null | grep -m1 -E '^\$G[NP]RMC,[0-9.]+,A,'; then
         echo "✓ GPS time data received"
+    else
+        echo "✗ GPS time data timeout (no valid RMC sentence)"
     fi
 else
     echo "Cannot test GPS time - gpspipe not available"
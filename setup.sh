@@ -113,7 +113,7 @@ echo ""
 echo -e "${CYAN}Checking if system is already configured...${NC}"
 
 # Check if all required packages are installed
-REQUIRED_PACKAGES=("python3-pip" "python3-venv" "python3-requests" "python3-ntplib" "gpsd" "gpsd-clients" "chrony" "pps-tools" "i2c-tools" "shellcheck")
+REQUIRED_PACKAGES=("python3-pip" "python3-venv" "python3-requests" "gpsd" "gpsd-clients" "chrony" "pps-tools" "i2c-tools" "shellcheck")
 MISSING_PACKAGES=()
 
 for package in "${REQUIRED_PACKAGES[@]}"; do
@@ -189,10 +189,11 @@ if [[ "$SKIP_PACKAGES" == "false" ]]; then
         echo -e "${GREEN}✓ python3-requests already installed${NC}"
     fi
 
-    if ! package_installed python3-ntplib; then
-        sudo apt install -y python3-ntplib
+    # Optional: faster JSON parsing for weather replies (clock.py falls back to json)
+    if ! python_module_available orjson; then
+        sudo apt install -y python3-orjson 2>/dev/null || echo "python3-orjson not available - using the standard json module"
     else
-        echo -e "${GREEN}✓ python3-ntplib already installed${NC}"
+        echo -e "${GREEN}✓ python3-orjson already installed${NC}"
     fi
 
     # Install Adafruit packages via pip (not available in apt)
@@ -1,14 +1,19 @@
 """Tests for clock.py — weather API resilience, temperature conversion, display logic.
 
-Import strategy: clock.py runs module-level code (config validation, os.chdir,
-hardware init) so we must stub hardware imports and redirect the config file read
+Import strategy: clock.py runs module-level code (config validation, hardware
+imports) so we must stub hardware imports and redirect the config file read
 BEFORE the module runs. Everything after that can be tested by patching module globals.
 """
 
-import configparser as _configparser
+import builtins
+import dataclasses
+import json
 import os
+import socket
+import struct
 import sys
 import tempfile
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -16,7 +21,7 @@ import requests
 
 # ── 1. Stub hardware-only imports before clock is loaded ─────────────────────
 #    These packages are only available on a Pi; the stubs let tests run anywhere.
-for _mod in ("board", "busio", "ntplib"):
+for _mod in ("board", "busio"):
     sys.modules.setdefault(_mod, MagicMock())
 
 _ht_mock = MagicMock()
@@ -28,6 +33,7 @@ _VALID_CONFIG = """\
 [Weather]
 api_key = test_api_key_12345678
 zip_code = 28801
+refresh_minutes = 15
 
 [Display]
 time_format = 12
@@ -57,19 +63,19 @@ with open(_config_path, "w") as _f:
     _f.write(_VALID_CONFIG)
 
 # ── 3. Import clock with the config redirected to our temp file ───────────────
-#    configparser.read() silently ignores missing files, so we redirect
-#    /opt/rpi-clock/config.ini → our temp file before the module runs.
-_orig_cp_read = _configparser.ConfigParser.read
+#    load_config() silently falls back to defaults for a missing file, so we
+#    redirect /opt/rpi-clock/config.ini → our temp file before the module runs.
+_orig_open = builtins.open
 
 
-def _redirect_config_read(self, filenames, encoding=None):
-    if isinstance(filenames, str) and "rpi-clock" in filenames:
-        return _orig_cp_read(self, _config_path, encoding)
-    return _orig_cp_read(self, filenames, encoding)
+def _redirect_config_open(file, *args, **kwargs):
+    if isinstance(file, str) and "rpi-clock" in file:
+        file = _config_path
+    return _orig_open(file, *args, **kwargs)
 
 
 with (
-    patch.object(_configparser.ConfigParser, "read", _redirect_config_read),
+    patch("builtins.open", _redirect_config_open),
     patch("pathlib.Path.exists", return_value=True),
 ):
     import clock  # noqa: E402
@@ -82,10 +88,13 @@ _VALID_OWM_RESPONSE = {
 }
 
 
-def _mock_response(json_data=None, raise_for_status=None):
+def _mock_response(json_data=None, raise_for_status=None, headers=None):
     """Build a minimal mock requests.Response."""
     resp = Mock()
     resp.json.return_value = json_data if json_data is not None else {}
+    resp.content = json.dumps(resp.json.return_value).encode()
+    resp.raw.read.return_value = resp.content
+    resp.headers = headers if headers is not None else {}
     if raise_for_status is not None:
         resp.raise_for_status.side_effect = raise_for_status
     else:
@@ -107,9 +116,16 @@ def reset_weather_globals():
     """Give each test a fresh mock Session and known module globals."""
     session = MagicMock()
     clock.SESSION = session
-    clock.WEATHER_PARAMS = {"zip": "28801", "appid": "test_key", "units": "metric"}
-    clock.TEMP_UNIT = "C"
-    yield session
+    clock.WEATHER_URL = (
+        f"{clock.API_ENDPOINT}?zip=28801&appid=test_key&units=metric"
+    )
+    with (
+        patch.object(clock, "CFG", dataclasses.replace(clock.CFG, temp_unit="C")),
+        patch.object(clock, "_weather_etag", None),
+        patch.object(clock, "_weather_last_modified", None),
+        patch.object(clock, "_weather_validated", None),
+    ):
+        yield session
 
 
 @pytest.fixture(autouse=True)
@@ -119,6 +135,116 @@ def no_sleep():
         yield
 
 
+# ── validate_config ───────────────────────────────────────────────────────────
+
+
+def _parsed_config(text):
+    return clock.parse_ini(text.splitlines())
+
+
+def _validate(text):
+    with (
+        patch.object(clock, "config", _parsed_config(text)),
+        patch("pathlib.Path.exists", return_value=True),
+    ):
+        return clock.validate_config()
+
+
+class TestIniParsing:
+    def test_sections_options_and_comments(self):
+        parsed = clock.parse_ini(
+            ["# comment", "[Weather]", "; also a comment", "API_KEY = abc=def", ""]
+        )
+        assert parsed == {"Weather": {"api_key": "abc=def"}}
+
+    def test_colon_delimiter_like_configparser(self):
+        parsed = clock.parse_ini(
+            ["[Weather]", "api_key: abc", "[CustomText]", "text = Time: 12:00"]
+        )
+        assert parsed == {
+            "Weather": {"api_key": "abc"},
+            "CustomText": {"text": "Time: 12:00"},
+        }
+
+    def test_unparseable_line_is_reported(self, capsys):
+        assert clock.parse_ini(["[Weather]", "api_key abc"]) == {"Weather": {}}
+        assert "Ignoring unparseable config line: api_key abc" in (
+            capsys.readouterr().out
+        )
+
+    def test_empty_value(self):
+        assert clock.parse_ini(["[CustomText]", "text ="]) == {
+            "CustomText": {"text": ""}
+        }
+
+    def test_load_config_overlays_defaults(self):
+        path = os.path.join(_tmp_dir, "partial.ini")
+        with open(path, "w") as f:
+            f.write("[Display]\ntemp_unit = F\n")
+        config = clock.load_config(path)
+        assert config["Display"]["temp_unit"] == "F"
+        assert config["Display"]["brightness"] == "0.8"
+        assert config["NTP"]["preferred_server"] == "127.0.0.1"
+
+    def test_missing_file_gives_defaults(self):
+        config = clock.load_config(os.path.join(_tmp_dir, "missing.ini"))
+        assert config == clock.CONFIG_DEFAULTS
+
+
+class TestValidateConfig:
+    def test_valid_config_passes(self):
+        assert _validate(_VALID_CONFIG) is True
+
+    def test_missing_config_file_fails(self):
+        with patch("pathlib.Path.exists", return_value=False):
+            assert clock.validate_config() is False
+
+    def test_bad_zip_code_is_reported(self, capsys):
+        assert _validate(_VALID_CONFIG.replace("28801", "2880")) is False
+        assert "ZIP code must be 5 digits" in capsys.readouterr().out
+
+    def test_out_of_range_cycle_value_is_reported(self, capsys):
+        text = _VALID_CONFIG.replace("time_display = 2", "time_display = 61")
+        assert _validate(text) is False
+        assert "time_display must be between 1 and 60 seconds" in (
+            capsys.readouterr().out
+        )
+
+    def test_invalid_smooth_scroll_is_reported_not_raised(self, capsys):
+        text = _VALID_CONFIG.replace("smooth_scroll = false", "smooth_scroll = maybe")
+        assert _validate(text) is False
+        assert "smooth_scroll must be 'true' or 'false'" in capsys.readouterr().out
+
+    def test_disabled_custom_text_skips_remaining_checks(self):
+        text = _VALID_CONFIG.replace("interval_minutes = 15", "interval_minutes = x")
+        assert _validate(text) is True
+
+    def test_enabled_custom_text_requires_text(self, capsys):
+        text = _VALID_CONFIG.replace("enabled = false", "enabled = true")
+        assert _validate(text) is False
+        assert "CustomText text cannot be empty when enabled" in (
+            capsys.readouterr().out
+        )
+
+    def test_missing_section_is_reported(self, capsys):
+        text = _VALID_CONFIG.replace("[NTP]\npreferred_server = 127.0.0.1\n", "")
+        assert _validate(text) is False
+        assert "Missing configuration section: [NTP]" in capsys.readouterr().out
+
+
+class TestCfgSnapshot:
+    def test_is_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            clock.CFG.temp_unit = "F"
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(clock.CFG, "__dict__")
+
+    def test_derived_intervals_are_in_seconds(self):
+        assert clock.CFG.weather_refresh_secs == 15 * 60
+        assert clock.CFG.custom_text_interval_secs == 15 * 60
+
+
 # ── celsius_to_fahrenheit ─────────────────────────────────────────────────────
 
 
@@ -163,6 +289,397 @@ class TestBuildTempString:
         # 99.9 truncates to 99, not 100
         assert clock.build_temp_string(99.9, "C") == "99C"
 
+    def test_small_negative_shows_zero(self):
+        assert clock.build_temp_string(-0.4, "C") == "0C"
+
+    def test_table_strings_are_shared(self):
+        assert clock.build_temp_string(20.1, "C") is clock.build_temp_string(20.9, "C")
+
+    def test_outside_table_is_formatted(self):
+        assert clock.build_temp_string(-75.2, "F") == "-75F"
+
+
+# ── I2C probing ───────────────────────────────────────────────────────────────
+
+
+def _fake_bus(write_error=None, read_error=None):
+    bus = MagicMock()
+    bus.try_lock.return_value = True
+    bus.writeto.side_effect = write_error
+    bus.readfrom_into.side_effect = read_error
+    return bus
+
+
+class TestKernelModuleLoaded:
+    def test_uses_sysfs_entry(self):
+        exists = {"/sys/module", "/sys/module/i2c_dev"}
+        with patch.object(clock.os.path, "isdir", side_effect=exists.__contains__):
+            assert clock.kernel_module_loaded("i2c_dev") is True
+            assert clock.kernel_module_loaded("i2c_bcm2835") is False
+
+    def test_falls_back_to_proc_modules(self, tmp_path):
+        modules = tmp_path / "modules"
+        modules.write_text("i2c_dev 20480 0 - Live 0x0000000000000000\n")
+        real_open = builtins.open
+        with (
+            patch.object(clock.os.path, "isdir", return_value=False),
+            patch(
+                "builtins.open",
+                side_effect=lambda f, *a, **k: real_open(
+                    modules if f == "/proc/modules" else f, *a, **k
+                ),
+            ),
+        ):
+            assert clock.kernel_module_loaded("i2c_dev") is True
+            assert clock.kernel_module_loaded("i2c_bcm2835") is False
+            assert clock.kernel_module_loaded("i2c") is False  # not a prefix match
+
+
+class TestHardwarePrerequisites:
+    @pytest.fixture(autouse=True)
+    def modules_and_node_present(self):
+        with (
+            patch.object(clock, "kernel_module_loaded", return_value=True),
+            patch("pathlib.Path.exists", return_value=True),
+        ):
+            yield
+
+    def test_device_access_skips_group_lookup(self):
+        with (
+            patch.object(clock.os, "access", return_value=True),
+            patch("grp.getgrnam") as getgrnam,
+        ):
+            assert clock.check_hardware_prerequisites() is True
+        getgrnam.assert_not_called()
+
+    def test_denied_access_explains_missing_group(self, capsys):
+        with (
+            patch.object(clock.os, "access", return_value=False),
+            patch("grp.getgrnam", return_value=Mock(gr_gid=998)),
+            patch.object(clock.os, "getgroups", return_value=[1000]),
+        ):
+            assert clock.check_hardware_prerequisites() is False
+        assert "User not in i2c group" in capsys.readouterr().out
+
+    def test_missing_group_is_reported(self, capsys):
+        with (
+            patch.object(clock.os, "access", return_value=False),
+            patch("grp.getgrnam", side_effect=KeyError("i2c")),
+        ):
+            assert clock.check_hardware_prerequisites() is False
+        assert "i2c group does not exist" in capsys.readouterr().out
+
+
+@pytest.fixture
+def fresh_i2c():
+    clock._get_i2c.cache_clear()
+    yield
+    clock._get_i2c.cache_clear()
+
+
+class TestI2CProbe:
+    def test_ack_on_empty_write(self):
+        bus = _fake_bus()
+        assert clock.probe_i2c_address(bus, 0x70) is True
+        bus.readfrom_into.assert_not_called()
+        bus.unlock.assert_called_once()
+
+    def test_falls_back_to_one_byte_read(self):
+        bus = _fake_bus(write_error=OSError(22, "Invalid argument"))
+        assert clock.probe_i2c_address(bus, 0x70) is True
+        bus.readfrom_into.assert_called_once()
+
+    def test_no_device(self):
+        nack = OSError(121, "Remote I/O error")
+        bus = _fake_bus(write_error=nack, read_error=nack)
+        assert clock.probe_i2c_address(bus, 0x70) is False
+        bus.unlock.assert_called_once()
+
+    def test_scan_skips_full_walk_when_display_answers(self, fresh_i2c):
+        bus = _fake_bus()
+        with patch.object(clock.busio, "I2C", return_value=bus):
+            assert clock.scan_i2c_devices() is True
+        bus.scan.assert_not_called()
+
+    def test_scan_walks_bus_on_miss(self, fresh_i2c):
+        nack = OSError(121, "Remote I/O error")
+        bus = _fake_bus(write_error=nack, read_error=nack)
+        bus.scan.return_value = [0x3C]
+        with patch.object(clock.busio, "I2C", return_value=bus):
+            assert clock.scan_i2c_devices() is False
+        bus.scan.assert_called_once()
+
+    def test_bus_open_failure_is_reported_not_raised(self, fresh_i2c, capsys):
+        with patch.object(clock.busio, "I2C", side_effect=AttributeError("SCL")):
+            assert clock.scan_i2c_devices() is False
+        assert "Unexpected error scanning I2C devices" in capsys.readouterr().out
+
+    def test_bus_opened_once(self, fresh_i2c):
+        with patch.object(clock.busio, "I2C", return_value=_fake_bus()) as ctor:
+            assert clock._get_i2c() is clock._get_i2c()
+        ctor.assert_called_once()
+
+
+# ── set_colon ─────────────────────────────────────────────────────────────────
+
+
+# Fake font: NUMBERS[i] == 0x40 + i, so rendered bytes are easy to read back
+_FAKE_NUMBERS = tuple(0x40 + i for i in range(37))
+
+
+@pytest.fixture
+def fake_font():
+    clock._marquee_frames.cache_clear()
+    clock._text_frame.cache_clear()
+    with patch.object(clock.segments, "NUMBERS", _FAKE_NUMBERS, create=True):
+        yield
+    clock._marquee_frames.cache_clear()
+    clock._text_frame.cache_clear()
+
+
+@pytest.fixture
+def fake_display(fake_font):
+    """Install a stand-in Seg7x4 with a real 17-byte buffer and one I2C device."""
+    disp = MagicMock()
+    disp._buffer = bytearray(17)
+    disp.i2c_device = [MagicMock()]
+    with (
+        patch.object(clock, "display", disp),
+        patch.object(clock, "_display_device", disp.i2c_device[0]),
+        patch.object(clock, "last_display_text", None),
+        patch.object(clock, "_last_flushed", bytearray()),
+    ):
+        yield disp
+
+
+class TestSetColon:
+    def test_writes_only_the_colon_register(self, fake_display):
+        clock.set_colon(True)
+        fake_display.i2c_device[0].write.assert_called_once_with(bytes((0x04, 0x02)))
+        fake_display.show.assert_not_called()
+
+    def test_updates_library_buffer(self, fake_display):
+        clock.set_colon(True)
+        assert fake_display._buffer[clock.COLON_REGISTER + 1] == clock.COLON_ON
+        clock.set_colon(False)
+        assert fake_display._buffer[clock.COLON_REGISTER + 1] == 0x00
+
+    def test_reuses_prebuilt_command_buffers(self, fake_display):
+        clock.set_colon(True)
+        clock.set_colon(False)
+        writes = [c.args[0] for c in fake_display.i2c_device[0].write.call_args_list]
+        assert writes[0] is clock.COLON_ON_WRITE
+        assert writes[1] is clock.COLON_OFF_WRITE
+
+    def test_skips_write_when_unchanged(self, fake_display):
+        clock.set_colon(False)
+        fake_display.i2c_device[0].write.assert_not_called()
+
+    def test_no_display_is_a_no_op(self):
+        with patch.object(clock, "display", None):
+            clock.set_colon(True)
+
+
+class TestFastShow:
+    def test_writes_live_buffer_in_one_transaction(self, fake_display):
+        fake_display._buffer[1] = 0x3F
+        clock._fast_show()
+        device = fake_display.i2c_device[0]
+        device.write.assert_called_once_with(fake_display._buffer, end=11)
+        device.__enter__.assert_called_once()
+        fake_display.show.assert_not_called()
+
+    def test_unchanged_frame_is_not_resent(self, fake_display):
+        fake_display._buffer[1] = 0x3F
+        clock._fast_show()
+        clock._fast_show()
+        fake_display._buffer[1] = 0x06
+        clock._fast_show()
+        assert fake_display.i2c_device[0].write.call_count == 2
+
+    def test_colon_write_keeps_flushed_shadow_in_step(self, fake_display):
+        clock._fast_show()
+        clock.set_colon(True)
+        clock._fast_show()  # device already shows this frame
+        assert fake_display.i2c_device[0].write.call_count == 2
+
+    def test_write_display_flushes_once_per_change(self, fake_display):
+        clock.write_display("1234")
+        clock.write_display("1234")
+        assert clock.last_display_text == "1234"
+        assert fake_display.i2c_device[0].write.call_count == 1
+
+    def test_writes_prebuilt_frame_without_library_print(self, fake_display):
+        clock.write_display("12")
+        fake_display.print.assert_not_called()
+        assert _cells(fake_display._buffer) == [0, 0, 0x41, 0x42]
+
+    def test_static_text_keeps_colon_state(self, fake_display):
+        fake_display._buffer[clock.COLON_REGISTER + 1] = clock.COLON_ON
+        clock.write_display("1234")
+        assert fake_display._buffer[clock.COLON_REGISTER + 1] == clock.COLON_ON
+
+    def test_static_frames_are_cached(self, fake_display):
+        clock.write_display("1234")
+        clock.write_display("5678")
+        clock.write_display("1234")
+        assert clock._text_frame.cache_info().hits == 1
+
+    def test_equal_text_adopted_for_identity_check(self, fake_display):
+        clock.write_display("12" + "34"[:2])
+        same = "".join(["12", "34"])
+        clock.write_display(same)
+        assert clock.last_display_text is same
+        assert fake_display.i2c_device[0].write.call_count == 1
+
+    def test_display_time_repeats_the_same_string_object(self, fake_display):
+        now = clock.time.struct_time((2026, 10, 14, 21, 7, 0, 2, 287, 0))
+        with patch("time.localtime", return_value=now):
+            clock.display_time()
+            first = clock.last_display_text
+            clock.display_time()
+        assert clock.last_display_text is first
+
+
+# ── build_display_steps ───────────────────────────────────────────────────────
+
+
+class TestBuildDisplaySteps:
+    def test_smooth_scroll_uses_combined_scrolls(self):
+        clock.CFG = dataclasses.replace(clock.CFG, smooth_scroll=True)
+        steps = clock.build_display_steps()
+        assert [fn for fn, _, _ in steps] == [clock.scroll_combined_label_value] * 3
+        assert [build(20.7, 18.2, 64.6) for _, build, _ in steps] == [
+            ("Out", "20C"),
+            ("FEEL", "18C"),
+            ("rH", "65"),
+        ]
+        assert all(delay == 0 for _, _, delay in steps)
+
+    def test_stepwise_uses_configured_hold_times(self):
+        clock.CFG = dataclasses.replace(
+            clock.CFG,
+            smooth_scroll=False,
+            temp_display=4,
+            feels_like_display=5,
+            humidity_display=6,
+        )
+        steps = clock.build_display_steps()
+        assert [fn for fn, _, _ in steps] == [
+            clock.display_metric_with_message,
+            clock.display_metric_with_message,
+            clock.display_humidity,
+        ]
+        assert steps[0][1](20.0, 18.0, 60) == (
+            "Out",
+            clock.display_temperature,
+            20.0,
+            "C",
+        )
+        assert steps[2][1](20.0, 18.0, 60) == (60,)
+        assert [delay for _, _, delay in steps] == [4, 5, 6]
+
+
+# ── marquee frames ────────────────────────────────────────────────────────────
+
+def _cells(frame):
+    return [frame[r + 1] for r in clock.DIGIT_REGISTERS]
+
+
+class TestMarqueeFrames:
+    def test_characters_shift_in_from_the_right(self, fake_font):
+        frames = clock._marquee_frames("12")
+        assert len(frames) == 2
+        assert _cells(frames[0]) == [0, 0, 0, 0x41]
+        assert _cells(frames[1]) == [0, 0, 0x41, 0x42]
+
+    def test_frames_are_full_register_writes(self, fake_font):
+        frame = clock._marquee_frames("8")[0]
+        assert len(frame) == 17
+        assert frame[0] == 0x00
+
+    def test_letters_and_blanks(self, fake_font):
+        frame = clock._marquee_frames("Out ")[-1]
+        assert _cells(frame) == [0x40 + 24, 0x40 + 30, 0x40 + 29, 0x00]
+
+    def test_decimal_point_joins_previous_character(self, fake_font):
+        frames = clock._marquee_frames("1.5")
+        assert len(frames) == 2
+        assert _cells(frames[0]) == [0, 0, 0, 0x41 | clock.DECIMAL_POINT]
+
+    def test_colon_character_sets_colon_register(self, fake_font):
+        frame = clock._marquee_frames("1:")[-1]
+        assert frame[clock.COLON_REGISTER + 1] == clock.COLON_ON
+
+    def test_marquee_writes_one_frame_per_step(self, fake_display, fake_font):
+        with patch.object(clock._shutdown, "wait", return_value=False) as wait:
+            clock._marquee("Out 20C   ", 0.1)
+        assert fake_display.i2c_device[0].write.call_count == 10
+        assert wait.call_count == 10
+        fake_display.marquee.assert_not_called()
+
+    def test_marquee_stops_on_shutdown(self, fake_display, fake_font):
+        with patch.object(clock._shutdown, "wait", return_value=True):
+            clock._marquee("Out 20C   ", 0.1)
+        assert fake_display.i2c_device[0].write.call_count == 1
+
+
+# ── display_time ──────────────────────────────────────────────────────────────
+
+
+class TestClockDigitTables:
+    def test_12_hour_table_maps_midnight_and_noon_to_12(self):
+        assert clock.HOUR_STR_12[0] == "12"
+        assert clock.HOUR_STR_12[12] == "12"
+        assert clock.HOUR_STR_12[13] == " 1"
+
+    def test_24_hour_table_is_space_padded(self):
+        assert clock.HOUR_STR_24[9] == " 9"
+        assert clock.HOUR_STR_24[23] == "23"
+
+    def test_minutes_are_zero_padded(self):
+        assert clock.MINUTE_STR[5] == "05"
+        assert len(clock.MINUTE_STR) == 60
+
+    def test_display_time_writes_table_lookup(self, fake_display):
+        now = clock.time.struct_time((2026, 10, 14, 21, 7, 0, 2, 287, 0))
+        with (
+            patch.object(clock, "HOUR_TABLE", clock.HOUR_STR_12),
+            patch("time.localtime", return_value=now),
+        ):
+            clock.display_time()
+        assert clock.last_display_text == " 907"
+
+
+# ── display_temperature / display_humidity ───────────────────────────────────
+
+
+class TestReadingDisplay:
+    def test_temperature_is_right_aligned(self, fake_display):
+        clock.display_temperature(7.9, "C")
+        assert clock.last_display_text == "  7C"
+
+    def test_temperature_is_limited_to_four_characters(self, fake_display):
+        clock.display_temperature(-105.0, "F")
+        assert clock.last_display_text == "-105"
+
+    def test_temperature_string_comes_from_table(self, fake_display):
+        with patch.object(clock, "build_temp_string") as mock_build:
+            clock.display_temperature(21.8, "C")
+        mock_build.assert_not_called()
+        table = clock.TEMP_DISPLAY_STRINGS["C"]
+        assert clock.last_display_text is table[21 - clock.TEMP_TABLE_MIN]
+        assert clock.last_display_text == " 21C"
+
+    def test_humidity_is_rounded_and_prefixed(self, fake_display):
+        clock.display_humidity(64.6)
+        assert clock.last_display_text == "rH65"
+
+    def test_humidity_is_zero_padded_from_table(self, fake_display):
+        clock.display_humidity(4.2)
+        assert clock.last_display_text is clock.HUMIDITY_STRINGS[4]
+        assert clock.last_display_text == "rH04"
+
 
 # ── fetch_weather: normal responses ──────────────────────────────────────────
 
@@ -173,7 +690,7 @@ class TestFetchWeatherNormal:
         assert clock.fetch_weather() == (20.0, 18.5, 65)
 
     def test_fahrenheit_conversion_preserves_precision(self, reset_weather_globals):
-        clock.TEMP_UNIT = "F"
+        clock.CFG = dataclasses.replace(clock.CFG, temp_unit="F")
         reset_weather_globals.get.return_value = _mock_response(
             {"main": {"temp": 22.7, "feels_like": 21.0, "humidity": 55}}
         )
@@ -282,6 +799,34 @@ class TestFetchWeatherMalformedResponse:
         )
         assert clock.fetch_weather() is None
 
+    def test_invalid_json_body(self, reset_weather_globals):
+        resp = _mock_response()
+        resp.raw.read.return_value = b"<html>Bad Gateway</html>"
+        reset_weather_globals.get.return_value = resp
+        assert clock.fetch_weather() is None
+
+    def test_oversized_body_rejected(self, reset_weather_globals):
+        resp = _mock_response(_VALID_OWM_RESPONSE)
+        resp.raw.read.return_value = b" " * (clock.WEATHER_MAX_BODY_BYTES + 1)
+        reset_weather_globals.get.return_value = resp
+        assert clock.fetch_weather() is None
+        resp.raw.read.assert_called_once_with(
+            clock.WEATHER_MAX_BODY_BYTES + 1, decode_content=True
+        )
+
+    def test_body_is_streamed_and_response_closed(self, reset_weather_globals):
+        resp = _mock_response(_VALID_OWM_RESPONSE)
+        reset_weather_globals.get.return_value = resp
+        clock.fetch_weather()
+        assert reset_weather_globals.get.call_args.kwargs["stream"] is True
+        resp.close.assert_called_once()
+
+    def test_response_closed_on_http_error(self, reset_weather_globals):
+        resp = _mock_response(raise_for_status=_http_error(401))
+        reset_weather_globals.get.return_value = resp
+        assert clock.fetch_weather() is None
+        resp.close.assert_called_once()
+
     def test_no_retry_on_parse_error(self, reset_weather_globals):
         """Malformed responses should not be retried — data won't fix itself."""
         reset_weather_globals.get.return_value = _mock_response({})
@@ -341,6 +886,15 @@ class TestFetchWeatherNetworkErrors:
         ]
         assert clock.fetch_weather() == (20.0, 18.5, 65)
 
+    def test_retries_back_off_exponentially(self, reset_weather_globals):
+        reset_weather_globals.get.side_effect = requests.exceptions.Timeout()
+        with patch("time.sleep") as mock_sleep:
+            clock.fetch_weather()
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2  # no sleep after the final attempt
+        assert 3 <= delays[0] <= 4
+        assert 6 <= delays[1] <= 7
+
     def test_four_timeouts_exceeds_retry_limit(self, reset_weather_globals):
         reset_weather_globals.get.side_effect = [
             requests.exceptions.Timeout(),
@@ -350,3 +904,484 @@ class TestFetchWeatherNetworkErrors:
         ]
         assert clock.fetch_weather() is None
         assert reset_weather_globals.get.call_count == 3
+
+
+# ── background weather refresh (stale-while-revalidate) ──────────────────────
+
+
+@pytest.fixture
+def weather_cache():
+    """Reset the weather cache and in-flight flag around each refresh test."""
+    clock.cached_weather_info = None
+    clock.weather_expires_at = 0.0
+    clock.weather_stale_at = 0.0
+    clock.weather_ttl = None
+    clock._weather_failures = 0
+    clock._refresh_inflight = False
+    yield
+    clock.cached_weather_info = None
+    clock.weather_expires_at = 0.0
+    clock.weather_stale_at = 0.0
+    clock.weather_ttl = None
+    clock._weather_failures = 0
+    clock._refresh_inflight = False
+
+
+class TestWeatherRefresh:
+    def test_worker_stores_successful_fetch(self, weather_cache):
+        with patch.object(clock, "fetch_weather", return_value=(20.0, 18.5, 65)):
+            clock._refresh_worker()
+        assert clock.cached_weather_info == (20.0, 18.5, 65)
+        assert clock.weather_expires_at > clock.time.monotonic()
+        assert clock._refresh_inflight is False
+
+    def test_worker_uses_longer_server_ttl(self, weather_cache):
+        def fake_fetch():
+            clock.weather_ttl = 3600
+            return (20.0, 18.5, 65)
+
+        with patch.object(clock, "fetch_weather", side_effect=fake_fetch):
+            clock._refresh_worker()
+        remaining = clock.weather_expires_at - clock.time.monotonic()
+        assert 3590 < remaining <= 3600
+
+    def test_short_server_ttl_never_undercuts_refresh_interval(self, weather_cache):
+        def fake_fetch():
+            clock.weather_ttl = 60
+            return (20.0, 18.5, 65)
+
+        with patch.object(clock, "fetch_weather", side_effect=fake_fetch):
+            clock._refresh_worker()
+        remaining = clock.weather_expires_at - clock.time.monotonic()
+        assert remaining > clock.CFG.weather_refresh_secs - 5
+
+    def test_success_sets_stale_if_error_deadline(self, weather_cache):
+        grace = clock.WEATHER_STALE_IF_ERROR_INTERVALS * clock.CFG.weather_refresh_secs
+        clock._weather_failures = 3
+        with patch.object(clock, "fetch_weather", return_value=(20.0, 18.5, 65)):
+            clock._refresh_worker()
+        assert clock.weather_stale_at == clock.weather_expires_at + grace
+        assert clock._weather_failures == 0
+
+    def test_worker_keeps_stale_data_on_failure(self, weather_cache):
+        now = clock.time.monotonic()
+        clock.cached_weather_info = (10.0, 9.0, 50)
+        clock.weather_expires_at = now - 1
+        clock.weather_stale_at = now + 60
+        with patch.object(clock, "fetch_weather", return_value=None):
+            clock._refresh_worker()
+        assert clock.cached_weather_info == (10.0, 9.0, 50)
+        assert clock._refresh_inflight is False
+
+    def test_worker_drops_reading_past_stale_if_error_window(self, weather_cache):
+        clock.cached_weather_info = (10.0, 9.0, 50)
+        clock.weather_stale_at = clock.time.monotonic() - 1
+        with patch.object(clock, "fetch_weather", return_value=None):
+            clock._refresh_worker()
+        assert clock.cached_weather_info is None
+        assert clock._refresh_inflight is False
+
+    def test_failure_defers_next_refresh_by_an_interval(self, weather_cache):
+        with patch.object(clock, "fetch_weather", return_value=None) as fetch:
+            clock._refresh_worker()
+            with patch("clock.threading.Thread") as mock_thread:
+                clock._maybe_refresh_weather_async()
+        fetch.assert_called_once()
+        mock_thread.assert_not_called()
+        remaining = clock.weather_expires_at - clock.time.monotonic()
+        assert remaining > clock.CFG.weather_refresh_secs - 5
+
+    def test_failure_backoff_doubles_up_to_cap(self, weather_cache):
+        interval = clock.CFG.weather_refresh_secs
+        gaps = []
+        with (
+            patch.object(clock, "WEATHER_FAILURE_MAX_DOUBLINGS", 2),
+            patch.object(clock, "fetch_weather", return_value=None),
+        ):
+            for _ in range(4):
+                clock._refresh_worker()
+                remaining = clock.weather_expires_at - clock.time.monotonic()
+                gaps.append(round(remaining / interval))
+        assert gaps == [1, 2, 4, 4]
+
+    def test_starts_thread_when_cache_empty(self, weather_cache):
+        with patch("clock.threading.Thread") as mock_thread:
+            clock._maybe_refresh_weather_async()
+        mock_thread.assert_called_once_with(target=clock._refresh_worker, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+        assert clock._refresh_inflight is True
+
+    def test_no_second_thread_while_in_flight(self, weather_cache):
+        clock._refresh_inflight = True
+        with patch("clock.threading.Thread") as mock_thread:
+            clock._maybe_refresh_weather_async()
+        mock_thread.assert_not_called()
+
+    def test_no_refresh_while_cache_is_fresh(self, weather_cache):
+        clock.cached_weather_info = (20.0, 18.5, 65)
+        clock.weather_expires_at = clock.time.monotonic() + 60
+        with patch("clock.threading.Thread") as mock_thread:
+            clock._maybe_refresh_weather_async()
+        mock_thread.assert_not_called()
+
+
+# ── retry_backoff ─────────────────────────────────────────────────────────────
+
+
+class TestRetryBackoff:
+    def test_doubles_per_attempt(self):
+        with patch("random.uniform", return_value=0.0):
+            assert [clock.retry_backoff(a) for a in range(3)] == [3.0, 6.0, 12.0]
+
+    def test_is_capped(self):
+        with patch("random.uniform", return_value=0.0):
+            assert clock.retry_backoff(10) == clock.RETRY_MAX_DELAY
+
+    def test_adds_up_to_one_second_of_jitter(self):
+        for _ in range(20):
+            assert 3.0 <= clock.retry_backoff(0) <= 4.0
+
+
+# ── parse_cache_ttl ───────────────────────────────────────────────────────────
+
+
+class TestParseCacheTtl:
+    def test_max_age(self):
+        assert clock.parse_cache_ttl({"Cache-Control": "public, max-age=600"}) == 600
+
+    def test_max_age_takes_precedence_over_expires(self):
+        headers = {
+            "Cache-Control": "max-age=300",
+            "Date": "Wed, 14 Oct 2026 08:00:00 GMT",
+            "Expires": "Wed, 14 Oct 2026 09:00:00 GMT",
+        }
+        assert clock.parse_cache_ttl(headers) == 300
+
+    def test_expires_relative_to_date_header(self):
+        headers = {
+            "Date": "Wed, 14 Oct 2026 08:00:00 GMT",
+            "Expires": "Wed, 14 Oct 2026 08:10:00 GMT",
+        }
+        assert clock.parse_cache_ttl(headers) == 600
+
+    def test_expires_in_the_past_is_zero(self):
+        headers = {
+            "Date": "Wed, 14 Oct 2026 08:10:00 GMT",
+            "Expires": "Wed, 14 Oct 2026 08:00:00 GMT",
+        }
+        assert clock.parse_cache_ttl(headers) == 0
+
+    def test_malformed_expires_is_ignored(self):
+        assert clock.parse_cache_ttl({"Expires": "0"}) is None
+
+    def test_no_caching_headers(self):
+        assert clock.parse_cache_ttl({}) is None
+
+    def test_fetch_weather_records_ttl(self, reset_weather_globals):
+        reset_weather_globals.get.return_value = _mock_response(
+            _VALID_OWM_RESPONSE, headers={"Cache-Control": "max-age=120"}
+        )
+        clock.fetch_weather()
+        assert clock.weather_ttl == 120
+
+
+# ── fetch_weather: conditional requests ─────────────────────────────────────
+
+
+class TestConditionalFetch:
+    _VALIDATORS = {"ETag": '"abc"', "Last-Modified": "Wed, 14 Oct 2026 12:00:00 GMT"}
+
+    def test_first_fetch_is_unconditional(self, reset_weather_globals):
+        reset_weather_globals.get.return_value = _mock_response(_VALID_OWM_RESPONSE)
+        clock.fetch_weather()
+        assert reset_weather_globals.get.call_args.kwargs["headers"] == {}
+
+    def test_validators_are_sent_on_next_fetch(self, reset_weather_globals):
+        reset_weather_globals.get.return_value = _mock_response(
+            _VALID_OWM_RESPONSE, headers=self._VALIDATORS
+        )
+        clock.fetch_weather()
+        clock.fetch_weather()
+        assert reset_weather_globals.get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 14 Oct 2026 12:00:00 GMT",
+        }
+
+    def test_not_modified_returns_previous_reading(self, reset_weather_globals):
+        reset_weather_globals.get.return_value = _mock_response(
+            _VALID_OWM_RESPONSE, headers=self._VALIDATORS
+        )
+        first = clock.fetch_weather()
+        not_modified = _mock_response(headers={"Cache-Control": "max-age=300"})
+        not_modified.status_code = 304
+        not_modified.raw.read.return_value = b""
+        reset_weather_globals.get.return_value = not_modified
+        assert clock.fetch_weather() == first
+        # The empty body is still read to its end so the connection is reused
+        not_modified.raw.read.assert_called_once()
+        assert clock.weather_ttl == 300
+
+    def test_error_body_is_read_before_raising(self, reset_weather_globals):
+        error = _mock_response(raise_for_status=_http_error(401))
+        reset_weather_globals.get.return_value = error
+        assert clock.fetch_weather() is None
+        error.raw.read.assert_called_once()
+        error.close.assert_called_once()
+
+
+# ── initialize_http_session ───────────────────────────────────────────────────
+
+
+class TestInitializeHttpSession:
+    def test_mounts_keep_alive_adapter_with_server_error_retries(self):
+        assert clock.initialize_http_session() is True
+        adapter = clock.SESSION.get_adapter(clock.API_ENDPOINT)
+        assert isinstance(adapter, clock.keep_alive_adapter_class())
+        assert adapter.max_retries.status_forcelist == [500, 502, 503, 504]
+        # connect/read errors are retried by fetch_weather, not urllib3
+        assert adapter.max_retries.connect == 0
+        assert adapter.max_retries.read == 0
+
+    def test_sets_client_headers(self):
+        clock.initialize_http_session()
+        assert clock.SESSION.headers["User-Agent"] == "rpi-clock/1.0"
+        assert clock.SESSION.headers["Accept-Encoding"] == "gzip"
+
+    def test_pooled_sockets_enable_so_keepalive(self):
+        clock.initialize_http_session()
+        adapter = clock.SESSION.get_adapter(clock.API_ENDPOINT)
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (clock.socket.SOL_SOCKET, clock.socket.SO_KEEPALIVE, 1) in options
+
+    def test_builds_weather_url(self):
+        clock.initialize_http_session()
+        assert clock.WEATHER_URL == (
+            f"{clock.API_ENDPOINT}?zip={clock.CFG.zip_code}"
+            f"&appid={clock.CFG.api_key}&units=metric"
+        )
+
+    def test_fetch_uses_prebuilt_url(self, reset_weather_globals):
+        reset_weather_globals.get.return_value = _mock_response(_VALID_OWM_RESPONSE)
+        clock.fetch_weather()
+        args, kwargs = reset_weather_globals.get.call_args
+        assert args == (clock.WEATHER_URL,)
+        assert "params" not in kwargs
+
+    def test_fallback_without_session_still_sends_query(self):
+        clock.SESSION = None
+        clock.WEATHER_URL = None
+        with patch("requests.get") as mock_get:
+            mock_get.return_value = _mock_response(_VALID_OWM_RESPONSE)
+            clock.fetch_weather()
+        assert mock_get.call_args.args == (clock.build_weather_url(),)
+
+
+# ── shutdown event ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def shutdown_event():
+    """Make sure the module-level shutdown event is clear after each test."""
+    yield clock._shutdown
+    clock._shutdown.clear()
+
+
+class TestShutdown:
+    @pytest.fixture(autouse=True)
+    def prefetch(self):
+        """Keep main_loop() from starting real weather refresh threads."""
+        with patch.object(clock, "_maybe_refresh_weather_async") as refresh:
+            yield refresh
+
+    def test_signal_handler_sets_event_and_exits(self, shutdown_event):
+        with patch.object(clock, "display", None), pytest.raises(SystemExit):
+            clock.signal_handler(15, None)
+        assert shutdown_event.is_set()
+
+    def test_time_ticks_align_to_wall_clock_seconds(self, shutdown_event):
+        with (
+            patch.object(clock, "display", None),
+            patch("clock.time.time_ns", return_value=1000_250_000_000),
+            patch("clock.time.monotonic_ns", return_value=50_000_000_000),
+            patch.object(clock._shutdown, "wait", return_value=True) as wait,
+        ):
+            clock.main_loop()
+        wait.assert_called_once_with(pytest.approx(0.75))
+
+    def test_clock_stepping_back_redraws_time(self, shutdown_event):
+        minute = 60 * clock.NS_PER_SEC
+        with (
+            patch.object(clock, "display", None),
+            patch.object(clock, "CFG", dataclasses.replace(clock.CFG, time_display=1)),
+            patch.object(clock, "display_time") as display_time,
+            patch(
+                "clock.time.time_ns", side_effect=[10 * minute, 10 * minute, 9 * minute]
+            ),
+            patch("clock.time.monotonic_ns", return_value=0),
+            patch.object(clock._shutdown, "wait", return_value=True),
+        ):
+            clock.main_loop()
+        # initial render, then the redraw for the backwards step
+        assert display_time.call_count == 2
+
+    def test_rollover_during_initial_render_redraws(self, shutdown_event):
+        minute = 60 * clock.NS_PER_SEC
+        now = [10 * minute - 1]
+
+        def render():
+            now[0] = 10 * minute  # the minute ticks over while drawing
+
+        with (
+            patch.object(clock, "display", None),
+            patch.object(clock, "CFG", dataclasses.replace(clock.CFG, time_display=1)),
+            patch.object(clock, "display_time", side_effect=render) as display_time,
+            patch("clock.time.time_ns", side_effect=lambda: now[0]),
+            patch("clock.time.monotonic_ns", return_value=0),
+            patch.object(clock._shutdown, "wait", return_value=True),
+        ):
+            clock.main_loop()
+        assert display_time.call_count == 2
+
+    def test_main_loop_prefetches_weather_before_first_time_phase(
+        self, shutdown_event, prefetch
+    ):
+        shutdown_event.set()
+        with patch.object(clock, "display", None):
+            clock.main_loop()
+        prefetch.assert_called_once()
+
+    def test_main_loop_returns_once_shutdown_is_set(self, shutdown_event):
+        shutdown_event.set()
+        with patch.object(clock, "display", None):
+            clock.main_loop()  # would loop forever if the event were ignored
+
+
+# ── NTP offset cache ──────────────────────────────────────────────────────────
+
+
+def _ntp_reply(request, server_offset, stratum=1):
+    """Build a server reply echoing the request's transmit timestamp."""
+    now = clock.time.time() + server_offset + clock.NTP_EPOCH_OFFSET
+    stamp = struct.pack("!II", int(now), int(now % 1 * 2**32))
+    return bytes((0x24, stratum)) + bytes(22) + request[40:48] + stamp + stamp
+
+
+class _FakeNtpSocket:
+    """Datagram socket stand-in that answers like an NTP server."""
+
+    def __init__(self, server_offset=0.0, stratum=1, stale_first=False):
+        self.server_offset = server_offset
+        self.stratum = stratum
+        self.stale_first = stale_first
+        self.error = None
+        self.sent = []
+
+    def sendto(self, data, address):
+        self.sent.append((data, address))
+
+    def recvfrom(self, size):
+        if self.error:
+            raise self.error
+        request = self.sent[-1][0]
+        if self.stale_first:
+            self.stale_first = False
+            request = bytes(48)  # reply to some earlier request
+        return _ntp_reply(request, self.server_offset, self.stratum), ("", 123)
+
+
+@pytest.fixture
+def ntp_state():
+    """Give each test a fake NTP socket and a clean offset cache."""
+    sock = _FakeNtpSocket()
+    with (
+        patch.object(clock, "ntp_socket", sock),
+        patch.object(clock, "ntp_offset", 0.0),
+        patch.object(clock, "last_ntp_sync", None),
+        patch.object(clock, "_ntp_failing", False),
+    ):
+        yield sock
+
+
+class TestNtpOffsetCache:
+    def test_sync_stores_offset(self, ntp_state):
+        ntp_state.server_offset = 0.25
+        assert clock.sync_ntp_offset() is True
+        assert clock.ntp_offset == pytest.approx(0.25, abs=0.01)
+        assert clock.last_ntp_sync is not None
+
+    def test_request_is_sntp_v4_client_packet(self, ntp_state):
+        clock.sync_ntp_offset()
+        request, address = ntp_state.sent[0]
+        assert len(request) == clock.NTP_PACKET_LEN
+        assert request[0] == 0x23
+        assert address == (clock.CFG.preferred_ntp_server, clock.NTP_PORT)
+
+    def test_stale_reply_is_skipped(self, ntp_state):
+        ntp_state.server_offset = 2.0
+        ntp_state.stale_first = True
+        assert clock.sync_ntp_offset() is True
+        assert clock.ntp_offset == pytest.approx(2.0, abs=0.01)
+
+    def test_failed_sync_keeps_previous_offset(self, ntp_state):
+        clock.ntp_offset = 1.5
+        ntp_state.error = socket.timeout("timed out")
+        assert clock.sync_ntp_offset() is False
+        assert clock.ntp_offset == 1.5
+
+    def test_kiss_of_death_is_rejected(self, ntp_state):
+        ntp_state.stratum = 0
+        assert clock.sync_ntp_offset() is False
+        assert clock.last_ntp_sync is None
+
+    def test_repeated_failures_are_logged_once(self, ntp_state, capsys):
+        ntp_state.error = socket.timeout("timed out")
+        clock.sync_ntp_offset()
+        clock.sync_ntp_offset()
+        assert capsys.readouterr().out.count("NTP synchronization failed") == 1
+        ntp_state.error = None
+        assert clock.sync_ntp_offset() is True
+        assert "restored" in capsys.readouterr().out
+
+    def test_current_time_applies_offset_without_network(self, ntp_state):
+        clock.ntp_offset = 3600.0
+        with patch("time.time", return_value=0.0):
+            result = clock.get_current_time()
+        assert result == clock.time.localtime(3600.0)
+        assert ntp_state.sent == []
+
+    def test_corrected_time_ns_applies_offset(self, ntp_state):
+        clock.ntp_offset = -1.5
+        with patch("time.time_ns", return_value=10 * clock.NS_PER_SEC):
+            assert clock.corrected_time_ns() == 8_500_000_000
+
+    def test_display_time_shows_corrected_time(self, ntp_state, fake_display):
+        clock.ntp_offset = 120.0
+        with patch("time.time", return_value=0.0):
+            clock.display_time()
+        now = clock.time.localtime(120.0)
+        expected = clock.HOUR_TABLE[now.tm_hour] + clock.MINUTE_STR[now.tm_min]
+        assert clock.last_display_text == expected
+
+    def test_refresher_syncs_until_shutdown(self, ntp_state):
+        ntp_state.server_offset = 0.5
+        with patch.object(clock._shutdown, "wait", side_effect=[False, True]) as wait:
+            clock._ntp_refresher()
+        assert len(ntp_state.sent) == 2
+        wait.assert_called_with(clock.NTP_SYNC_INTERVAL_SECS)
+        assert clock.ntp_offset == pytest.approx(0.5, abs=0.01)
+
+    def test_refresher_thread_stops_on_shutdown(self, ntp_state, shutdown_event):
+        assert clock.start_ntp_refresher() is True
+        (thread,) = [t for t in threading.enumerate() if t.name == "ntp-refresher"]
+        assert thread.daemon
+        shutdown_event.set()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_start_refresher_without_client(self, ntp_state):
+        with (
+            patch.object(clock, "ntp_socket", None),
+            patch("clock.threading.Thread") as mock_thread,
+        ):
+            assert clock.start_ntp_refresher() is False
+        mock_thread.assert_not_called()
@@ -60,6 +60,6 @@ echo "- Python packages (adafruit-circuitpython-ht16k33, requests, etc.)"
 echo ""
 echo "If you want to remove these packages as well, run:"
 echo "sudo apt remove gpsd gpsd-clients chrony"
-echo "pip3 uninstall adafruit-circuitpython-ht16k33 requests configparser ntplib"
+echo "pip3 uninstall adafruit-circuitpython-ht16k33 requests configparser"
 echo ""
 echo "Be careful when removing these packages as they might be used by other projects."